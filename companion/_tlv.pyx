@@ -0,0 +1,57 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled TLV stats encoder (optional accelerator for hotkey_companion).
+
+Drop-in replacement for hotkey_companion.encode_stats_tlv(); the Python
+version is used when this extension has not been built. Build in place:
+
+    pip install cython
+    cythonize -i companion/_tlv.pyx
+"""
+
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from libc.string cimport memcpy
+
+# Header + 1 count byte + up to 255 entries of [type][len][2-byte value]
+cdef enum:
+    TLV_HEADER_MAX = 8
+    TLV_BUF_SIZE = TLV_HEADER_MAX + 1021
+
+
+def encode_stats_tlv(list stats_list, bytes header=b""):
+    """Encode a list of (stat_type_id, value) pairs into TLV packet bytes.
+
+    Format: [count] [type1][len1][val1...] [type2][len2][val2...] ...
+    Values < 256 use 1 byte, values >= 256 use 2 bytes (little-endian).
+    header is copied in front of the count byte.
+    Output is byte-for-byte identical to the Python encoder.
+    """
+    cdef unsigned char buf[TLV_BUF_SIZE]
+    cdef Py_ssize_t n = len(stats_list)
+    cdef Py_ssize_t h = len(header)
+    cdef Py_ssize_t pos
+    cdef Py_ssize_t i
+    cdef long stat_type, value
+
+    if n > 255:
+        raise ValueError("too many stats for one TLV packet")
+    if h > TLV_HEADER_MAX:
+        raise ValueError("TLV header too long")
+    memcpy(buf, <const char *>header, h)
+    buf[h] = <unsigned char>n
+    pos = h + 1
+    for i in range(n):
+        stat_type, value = stats_list[i]
+        if stat_type < 0 or stat_type > 255:
+            raise ValueError("stat type out of range")
+        buf[pos] = <unsigned char>stat_type
+        if value < 256:
+            buf[pos + 1] = 1
+            buf[pos + 2] = <unsigned char>(value & 0xFF)
+            pos += 3
+        else:
+            buf[pos + 1] = 2
+            buf[pos + 2] = <unsigned char>(value & 0xFF)
+            buf[pos + 3] = <unsigned char>((value >> 8) & 0xFF)
+            pos += 4
+    return PyBytes_FromStringAndSize(<char *>buf, pos)
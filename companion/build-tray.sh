@@ -18,6 +18,10 @@ fi
 command -v "$PYTHON" >/dev/null || { echo "python3 not found"; exit 1; }
 "$PYTHON" -c "import nuitka" 2>/dev/null || { echo "Install nuitka: pip install nuitka"; exit 1; }
 
+# Bundle dbus-fast too when it is installed; the companion prefers it
+DBUS_FAST_PKG=""
+"$PYTHON" -c "import dbus_fast" 2>/dev/null && DBUS_FAST_PKG="--include-package=dbus_fast"
+
 "$PYTHON" -m nuitka \
     --standalone \
     --onefile \
@@ -25,6 +29,7 @@ command -v "$PYTHON" >/dev/null || { echo "python3 not found"; exit 1; }
     --include-data-dir=companion/data=companion/data \
     --include-package=companion \
     --include-package=dbus_next \
+    $DBUS_FAST_PKG \
     --nofollow-import-to=companion.ui.editor_main \
     --output-filename=crowpanel-tray \
     --output-dir=companion/build \
@@ -15,6 +15,12 @@ import uuid
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+try:
+    # Optional: faster parsing of config.json (stdlib json otherwise)
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 
 # Action type constants (must match device/protocol.h)
 ACTION_HOTKEY = 0
@@ -466,8 +472,8 @@ class ConfigManager:
     def load_json_file(self, path: str) -> bool:
         """Load config from JSON file. Handles v1→v2 migration. Returns True on success."""
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
+            with open(path, "rb") as f:
+                data = _loads(f.read())
             if not isinstance(data, dict):
                 return False
 
@@ -489,7 +495,7 @@ class ConfigManager:
             ensure_widget_ids(self.config)
             self._emit_changed()
             return True
-        except (json.JSONDecodeError, FileNotFoundError, IOError):
+        except (ValueError, FileNotFoundError, IOError):
             return False
 
     def save_json_file(self, path: str) -> bool:
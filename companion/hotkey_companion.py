@@ -9,7 +9,7 @@ ESP-NOW for rendering in the stats header bar.
 
 Also listens for systemd PrepareForShutdown D-Bus signal to notify the
 display bridge before PC powers off (enabling clock mode), and sends
-epoch time sync with each stats update for the display clock.
+an epoch time sync for the display clock on connect and every 12 hours.
 
 Usage:
     python3 hotkey_companion.py          # Run directly
@@ -17,7 +17,10 @@ Usage:
 
 Dependencies:
     pip install hidapi psutil pynvml
-    pip install dbus-next  # Optional: for shutdown detection
+    pip install dbus-fast  # Optional: for shutdown detection (or dbus-next)
+    pip install orjson     # Optional: faster config.json parsing
+    pip install pyudev     # Optional: hotplug wait instead of polling for the bridge
+    cythonize -i companion/_tlv.pyx  # Optional: compiled TLV encoder
 """
 
 import hid
@@ -29,8 +32,22 @@ import sys
 import signal
 import logging
 import os
+import queue
+import select
 import threading
-import asyncio
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pynvml as _pynvml
+except ImportError:
+    _pynvml = None
+
+try:
+    # Optional: faster parsing of config.json (stdlib json otherwise)
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
 
 from companion.action_executor import execute_action, execute_ddc_direct
 from companion.config_manager import get_config_manager, DEFAULT_CONFIG_DIR, DEFAULT_CONFIG_PATH
@@ -43,6 +60,10 @@ VENDOR_ID = 0x303A          # Espressif
 PRODUCT_ID = 0x1001         # CrowPanel HotkeyBridge
 PRODUCT_STRING = "HotkeyBridge"
 UPDATE_INTERVAL = 1.0       # Seconds between stat reports (1 Hz)
+STATS_KEEPALIVE = 2.0       # Max seconds between identical reports (display times out at 5 s)
+STATS_MAX_INTERVAL = STATS_KEEPALIVE  # Slowest sampling period while stats are steady
+STATS_BACKOFF_TICKS = 5     # Steady ticks before the sampling period doubles
+STATS_STEADY_DELTA = 2      # Max change of any stat value still counted as steady
 
 # Legacy StatsPayload format (v0.9.0 backwards compatibility)
 STATS_FORMAT = "<BBBBBBhh"  # 6 x uint8 + 2 x int16 = 10 bytes
@@ -59,8 +80,12 @@ STAT_TYPES = {
     'display_uptime': 0x15, 'proc_user':      0x16, 'proc_system':    0x17,
 }
 
-# Reverse lookup: type_id -> name
-STAT_ID_TO_NAME = {v: k for k, v in STAT_TYPES.items()}
+# Reverse lookup: type_id -> name, indexed directly by the (dense) type ID
+_STAT_MAX_ID = max(STAT_TYPES.values())
+STAT_ID_TO_NAME = tuple(
+    next((k for k, v in STAT_TYPES.items() if v == i), f"0x{i:02X}")
+    for i in range(_STAT_MAX_ID + 1)
+)
 
 # Default stats header config (matches original 8 hardcoded stats)
 DEFAULT_STATS_CONFIG = [
@@ -82,88 +107,207 @@ MSG_NOTIFICATION = 0x08
 MSG_BUTTON_PRESS = 0x0B
 MSG_DDC_CMD      = 0x0C
 
+# HID report ID of the vendor interface, prepended to every message
+HID_REPORT_ID = 0x06
+
+# Precomputed [report ID][message type] header for the variable-length stats
+# payload
+_HDR_STATS = bytes([HID_REPORT_ID, MSG_STATS])
+
+# Pre-compiled struct formats (avoids re-parsing the format on every call)
+_U16_LE = struct.Struct('<H')
+_I16_LE = struct.Struct('<h')
+
+# Whole fixed-size packets, [report ID][message type] included, so each send
+# is a single pack() with no header concatenation. 's' fields truncate and
+# zero-pad to their width.
+_POWER_STATE_PACKET = struct.Struct('<BBB')     # state
+_TIME_SYNC_PACKET = struct.Struct('<BBIh')      # TimeSyncMsg: epoch, tz_offset_min
+_NOTIFICATION_PACKET = struct.Struct('<BB32s100s116s')  # NotificationMsg
+
 # Power state values
 POWER_SHUTDOWN = 0
 POWER_WAKE     = 1
 POWER_LOCKED   = 2
 
+# Log names, indexed by power state value
+_POWER_STATE_NAMES = ("SHUTDOWN", "WAKE", "LOCKED")
+
+# Complete MSG_POWER_STATE packets, indexed by power state value; the
+# shutdown path then has nothing left to build before the write
+_POWER_STATE_PACKETS = tuple(
+    _POWER_STATE_PACKET.pack(HID_REPORT_ID, MSG_POWER_STATE, state)
+    for state in range(len(_POWER_STATE_NAMES))
+)
+
 # Retry interval when bridge is not found
 RETRY_INTERVAL = 5.0
 
+# Longest stop()/shutdown waits for queued HID writes to reach the bridge
+HID_FLUSH_TIMEOUT = 1.0
+
+# Worker threads for button actions and DDC commands; more presses queue
+ACTION_WORKERS = 4
+
+# With debug logging, seconds between reports of the slowest stat collectors
+PROFILE_LOG_INTERVAL = 60.0
+
+# Niceness increment for the headless daemon
+BACKGROUND_NICE = 10
+
 # ---------------------------------------------------------------------------
 # Globals
 # ---------------------------------------------------------------------------
 
-running = True
+# Path of the last bridge interface that opened successfully. Tried directly
+# on reconnect so a transient write failure doesn't trigger a full HID scan.
+_last_bridge_path = None
 shutdown_event = threading.Event()
 lock_event = threading.Event()
 unlock_event = threading.Event()
+# eventfd the headless main() blocks on; written by signals and on shutdown
+_wakeup_fd = None
+# eventfd _stats_loop waits on between ticks; written when one of the events
+# above is set or the service stops, so it reacts without waiting out a tick
+_stats_wake_fd = None
 
 # ---------------------------------------------------------------------------
 # Signal handling
 # ---------------------------------------------------------------------------
 
+def _signal_eventfd(fd):
+    if fd is not None:
+        try:
+            os.eventfd_write(fd, 1)
+        except OSError:
+            pass
+
+
+def _wake_main():
+    """Wake the headless main() so it exits without waiting out a sleep."""
+    _signal_eventfd(_wakeup_fd)
+
+
+def _wake_stats_loop():
+    """Wake _stats_loop so it handles a shutdown/lock change immediately."""
+    _signal_eventfd(_stats_wake_fd)
+
+
 def _signal_handler(signum, frame):
-    global running
     logging.info("Received signal %d, shutting down...", signum)
-    running = False
+    _wake_main()
 
 
 # ---------------------------------------------------------------------------
-# D-Bus shutdown listener
+# D-Bus supervisor
 # ---------------------------------------------------------------------------
 
-def _run_dbus_listener():
-    """Entry point for the D-Bus listener thread. Creates an asyncio
-    event loop and runs the async shutdown listener."""
+def _import_dbus():
+    """Return the D-Bus package: dbus-fast (Cython-accelerated marshalling)
+    if installed, else dbus-next, which has the same API.
+
+    Raises ImportError if neither is installed.
+    """
+    try:
+        import dbus_fast.aio
+        import dbus_fast as dbus
+    except ImportError:
+        import dbus_next.aio
+        import dbus_next as dbus
+    return dbus
+
+
+def _run_dbus_supervisor(follow_lock, notif_filter, notif_callback):
+    """Entry point for the D-Bus thread. Creates one asyncio event loop
+    and runs every D-Bus listener on it."""
+    import asyncio
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     try:
-        loop.run_until_complete(start_dbus_shutdown_listener())
+        loop.run_until_complete(
+            _dbus_supervisor(follow_lock, notif_filter, notif_callback))
     except Exception as exc:
-        logging.debug("D-Bus listener loop exited: %s", exc)
+        logging.debug("D-Bus supervisor loop exited: %s", exc)
     finally:
         loop.close()
 
 
-async def start_dbus_shutdown_listener():
-    """Connect to the system D-Bus, take a shutdown inhibitor lock, and
-    listen for the PrepareForShutdown signal from logind.
+async def _dbus_supervisor(follow_lock, notif_filter, notif_callback):
+    """Connect the system and session buses once and attach the shutdown,
+    session lock and notification listeners to them.
 
-    When PrepareForShutdown(True) fires, sets shutdown_event so the main
-    thread can send MSG_POWER_STATE to the bridge, then releases the
-    inhibitor lock to allow shutdown to proceed.
+    The system bus and its login1 Manager proxy are shared by the shutdown
+    and logind lock listeners; the session bus is shared by the ScreenSaver
+    lock listener and notification forwarding, and is only connected when
+    one of them is enabled.
 
-    Gracefully degrades if dbus-next is not installed or the system bus
-    is unavailable.
+    Gracefully degrades if no D-Bus library is installed or a bus is
+    unavailable.
     """
+    import asyncio
     try:
-        from dbus_next.aio import MessageBus
-        from dbus_next import BusType
+        dbus = _import_dbus()
     except ImportError:
         logging.warning(
-            "dbus-next not installed -- shutdown detection disabled. "
-            "Install with: pip install dbus-next"
+            "dbus-fast/dbus-next not installed -- shutdown detection, session "
+            "lock following and notification forwarding disabled. "
+            "Install with: pip install dbus-fast"
         )
         return
+    MessageBus = dbus.aio.MessageBus
+    BusType = dbus.BusType
 
-    try:
-        bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
-    except Exception as exc:
-        logging.warning("Cannot connect to system D-Bus: %s", exc)
-        return
+    buses = []
 
+    system_bus = None
+    manager = None
     try:
-        introspection = await bus.introspect(
+        system_bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+        buses.append(system_bus)
+        introspection = await system_bus.introspect(
             "org.freedesktop.login1", "/org/freedesktop/login1"
         )
-        proxy = bus.get_proxy_object(
+        proxy = system_bus.get_proxy_object(
             "org.freedesktop.login1",
             "/org/freedesktop/login1",
             introspection,
         )
         manager = proxy.get_interface("org.freedesktop.login1.Manager")
+    except Exception as exc:
+        logging.warning("Cannot connect to logind on system D-Bus: %s", exc)
+
+    session_bus = None
+    if follow_lock or notif_callback is not None:
+        try:
+            session_bus = await MessageBus(bus_type=BusType.SESSION).connect()
+            buses.append(session_bus)
+        except Exception as exc:
+            logging.warning("Cannot connect to session D-Bus: %s", exc)
+
+    if manager is not None:
+        await start_dbus_shutdown_listener(manager)
+    if follow_lock:
+        await _start_session_lock_listener(session_bus, system_bus, manager)
+    if notif_callback is not None and session_bus is not None:
+        await NotificationListener(notif_filter, notif_callback).run(session_bus)
+
+    if buses:
+        await asyncio.gather(*(bus.wait_for_disconnect() for bus in buses))
+
 
+# ---------------------------------------------------------------------------
+# D-Bus shutdown listener
+# ---------------------------------------------------------------------------
+
+async def start_dbus_shutdown_listener(manager):
+    """Take a shutdown inhibitor lock on the logind Manager interface and
+    listen for its PrepareForShutdown signal.
+
+    When PrepareForShutdown(True) fires, sets shutdown_event so the main
+    thread can send MSG_POWER_STATE to the bridge, then releases the
+    inhibitor lock to allow shutdown to proceed.
+    """
+    try:
         # Take a delay inhibitor lock so we have time to send the HID
         # shutdown message before the system powers off.
         inhibit_fd = await manager.call_inhibit(
@@ -172,7 +316,7 @@ async def start_dbus_shutdown_listener():
             "Sending shutdown signal to display bridge",
             "delay",
         )
-        # dbus-next returns the fd as an int
+        # dbus-next/dbus-fast return the fd as an int
         if hasattr(inhibit_fd, 'fileno'):
             inhibit_fd = inhibit_fd.fileno()
         logging.info("Shutdown inhibitor lock acquired (fd=%s)", inhibit_fd)
@@ -181,6 +325,7 @@ async def start_dbus_shutdown_listener():
             if start:
                 logging.info("PrepareForShutdown(True) received")
                 shutdown_event.set()
+                _wake_stats_loop()
                 # Release the inhibitor lock so shutdown can proceed
                 try:
                     os.close(inhibit_fd)
@@ -190,8 +335,6 @@ async def start_dbus_shutdown_listener():
 
         manager.on_prepare_for_shutdown(on_prepare_for_shutdown)
         logging.info("D-Bus shutdown listener active")
-
-        await bus.wait_for_disconnect()
     except Exception as exc:
         logging.warning("D-Bus shutdown listener error: %s", exc)
 
@@ -200,114 +343,85 @@ async def start_dbus_shutdown_listener():
 # D-Bus session lock listener
 # ---------------------------------------------------------------------------
 
-def _run_session_lock_listener():
-    """Entry point for session lock listener thread."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        loop.run_until_complete(_start_session_lock_listener())
-    except Exception as exc:
-        logging.debug("Session lock listener loop exited: %s", exc)
-    finally:
-        loop.close()
-
-
-async def _start_session_lock_listener():
+async def _start_session_lock_listener(session_bus, system_bus, manager):
     """Listen for screen lock/unlock via D-Bus.
 
-    Tries two approaches (both run concurrently):
+    Tries two approaches (both active at once):
     1. Session bus: org.freedesktop.ScreenSaver.ActiveChanged signal
        (works with KDE, GNOME, and most desktop environments)
     2. System bus: logind session Lock/Unlock signals
        (works with loginctl lock-session)
 
-    Gracefully degrades if dbus-next is unavailable.
+    Either bus (or the logind manager) may be None if it could not be
+    connected; that approach is then skipped.
     """
-    try:
-        from dbus_next.aio import MessageBus
-        from dbus_next import BusType, Message, MessageType
-    except ImportError:
-        logging.warning("dbus-next not installed -- session lock detection disabled")
-        return
+    dbus = _import_dbus()
+    Message, MessageType = dbus.Message, dbus.MessageType
 
-    tasks = []
+    started = False
 
     # --- Approach 1: Session bus ScreenSaver (KDE, GNOME, etc.) ---
-    try:
-        session_bus = await MessageBus(bus_type=BusType.SESSION).connect()
-
-        # Subscribe to ActiveChanged signal via match rule
-        await session_bus.call(Message(
-            destination='org.freedesktop.DBus',
-            path='/org/freedesktop/DBus',
-            interface='org.freedesktop.DBus',
-            member='AddMatch',
-            signature='s',
-            body=["type='signal',interface='org.freedesktop.ScreenSaver',member='ActiveChanged'"],
-        ))
-
-        def on_screensaver_message(msg):
-            if (msg.message_type == MessageType.SIGNAL and
-                    msg.member == 'ActiveChanged' and
-                    msg.signature == 'b'):
-                _on_session_lock_change(msg.body[0])
-
-        session_bus.add_message_handler(on_screensaver_message)
-        logging.info("D-Bus ScreenSaver lock listener active (session bus)")
-        tasks.append(session_bus.wait_for_disconnect())
-    except Exception as exc:
-        logging.warning("ScreenSaver listener failed: %s", exc)
+    if session_bus is not None:
+        try:
+            # Subscribe to ActiveChanged signal via match rule
+            await session_bus.call(Message(
+                destination='org.freedesktop.DBus',
+                path='/org/freedesktop/DBus',
+                interface='org.freedesktop.DBus',
+                member='AddMatch',
+                signature='s',
+                body=["type='signal',interface='org.freedesktop.ScreenSaver',member='ActiveChanged'"],
+            ))
+
+            def on_screensaver_message(msg):
+                if (msg.message_type == MessageType.SIGNAL and
+                        msg.member == 'ActiveChanged' and
+                        msg.signature == 'b'):
+                    _on_session_lock_change(msg.body[0])
+
+            session_bus.add_message_handler(on_screensaver_message)
+            logging.info("D-Bus ScreenSaver lock listener active (session bus)")
+            started = True
+        except Exception as exc:
+            logging.warning("ScreenSaver listener failed: %s", exc)
 
     # --- Approach 2: System bus logind session Lock/Unlock ---
-    try:
-        system_bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
-        introspection = await system_bus.introspect(
-            "org.freedesktop.login1", "/org/freedesktop/login1"
-        )
-        proxy = system_bus.get_proxy_object(
-            "org.freedesktop.login1",
-            "/org/freedesktop/login1",
-            introspection,
-        )
-        manager = proxy.get_interface("org.freedesktop.login1.Manager")
-
+    if manager is not None:
         try:
-            session_path = await manager.call_get_session_by_pid(os.getpid())
-        except Exception:
-            import getpass
-            username = getpass.getuser()
-            sessions = await manager.call_list_sessions()
-            session_path = None
-            for sess in sessions:
-                sid, uid, user, seat, path = sess
-                if user == username:
-                    session_path = path
-                    break
-            if session_path is None:
-                logging.warning("No logind session found for user")
+            try:
+                session_path = await manager.call_get_session_by_pid(os.getpid())
+            except Exception:
+                import getpass
+                username = getpass.getuser()
+                sessions = await manager.call_list_sessions()
+                session_path = None
+                for sess in sessions:
+                    sid, uid, user, seat, path = sess
+                    if user == username:
+                        session_path = path
+                        break
+                if session_path is None:
+                    logging.warning("No logind session found for user")
 
-        if session_path:
-            logging.info("Session lock listener: session path = %s", session_path)
-            session_introspection = await system_bus.introspect(
-                "org.freedesktop.login1", session_path
-            )
-            session_proxy = system_bus.get_proxy_object(
-                "org.freedesktop.login1",
-                session_path,
-                session_introspection,
-            )
-            session = session_proxy.get_interface("org.freedesktop.login1.Session")
-            session.on_lock(lambda: _on_session_lock_change(True))
-            session.on_unlock(lambda: _on_session_lock_change(False))
-            logging.info("D-Bus logind lock listener active (system bus)")
-            tasks.append(system_bus.wait_for_disconnect())
-    except Exception as exc:
-        logging.warning("Logind lock listener failed: %s", exc)
+            if session_path:
+                logging.info("Session lock listener: session path = %s", session_path)
+                session_introspection = await system_bus.introspect(
+                    "org.freedesktop.login1", session_path
+                )
+                session_proxy = system_bus.get_proxy_object(
+                    "org.freedesktop.login1",
+                    session_path,
+                    session_introspection,
+                )
+                session = session_proxy.get_interface("org.freedesktop.login1.Session")
+                session.on_lock(lambda: _on_session_lock_change(True))
+                session.on_unlock(lambda: _on_session_lock_change(False))
+                logging.info("D-Bus logind lock listener active (system bus)")
+                started = True
+        except Exception as exc:
+            logging.warning("Logind lock listener failed: %s", exc)
 
-    if tasks:
-        import asyncio
-        await asyncio.gather(*tasks)
-    else:
+    if not started:
         logging.warning("No lock listeners could be started")
 
 
@@ -320,6 +434,7 @@ def _on_session_lock_change(locked):
         logging.info("Session unlocked")
         unlock_event.set()
         lock_event.clear()
+    _wake_stats_loop()
 
 
 # ---------------------------------------------------------------------------
@@ -337,22 +452,11 @@ class NotificationListener:
         self.app_filter = app_filter
         self.callback = callback
 
-    async def run(self):
-        try:
-            from dbus_next.aio import MessageBus
-            from dbus_next import BusType, MessageType, Message
-        except ImportError:
-            logging.warning(
-                "dbus-next not installed -- notification forwarding disabled. "
-                "Install with: pip install dbus-next"
-            )
-            return
-
-        try:
-            bus = await MessageBus(bus_type=BusType.SESSION).connect()
-        except Exception as exc:
-            logging.warning("Cannot connect to session D-Bus: %s", exc)
-            return
+    async def run(self, bus):
+        """Install the Notify match rule and message handler on a
+        connected session bus."""
+        dbus = _import_dbus()
+        Message, MessageType = dbus.Message, dbus.MessageType
 
         try:
             # Add match rule to intercept Notify method calls
@@ -386,48 +490,123 @@ class NotificationListener:
             bus.add_message_handler(message_filter)
             logging.info("D-Bus notification listener active (filter: %s)",
                          list(self.app_filter) if self.app_filter else "ALL")
-            await bus.wait_for_disconnect()
         except Exception as exc:
             logging.warning("D-Bus notification listener error: %s", exc)
 
 
-def _run_notification_listener(app_filter, callback):
-    """Entry point for notification listener thread."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        listener = NotificationListener(app_filter, callback)
-        loop.run_until_complete(listener.run())
-    except Exception as exc:
-        logging.debug("Notification listener loop exited: %s", exc)
-    finally:
-        loop.close()
+def _encode_text(text):
+    """UTF-8 encode, taking the cheaper ASCII codec for ASCII-only text."""
+    return text.encode('ascii') if text.isascii() else text.encode('utf-8')
 
 
-def send_notification_to_display(device, app_name, summary, body, hid_lock=None):
+def send_notification_to_display(device, app_name, summary, body):
     """Encode and send a MSG_NOTIFICATION payload to the bridge.
 
     NotificationMsg: app_name[32] + summary[100] + body[116] = 248 bytes.
     Packet: [0x00 report ID] [0x08 MSG_NOTIFICATION] [248-byte payload]
     """
-    app_bytes = app_name.encode('utf-8')[:31] + b'\x00'
-    sum_bytes = summary.encode('utf-8')[:99] + b'\x00'
-    body_bytes = body.encode('utf-8')[:115] + b'\x00'
-
-    payload = (app_bytes.ljust(32, b'\x00') +
-               sum_bytes.ljust(100, b'\x00') +
-               body_bytes.ljust(116, b'\x00'))
+    # Cap each field one short of its width so the zero padding always
+    # leaves a NUL terminator
+    packet = _NOTIFICATION_PACKET.pack(
+        HID_REPORT_ID, MSG_NOTIFICATION,
+        _encode_text(app_name)[:31],
+        _encode_text(summary)[:99],
+        _encode_text(body)[:115])
 
     try:
-        if hid_lock:
-            with hid_lock:
-                device.write(b"\x06" + bytes([MSG_NOTIFICATION]) + payload)
-        else:
-            device.write(b"\x06" + bytes([MSG_NOTIFICATION]) + payload)
+        device.write(packet)
     except (IOError, OSError) as exc:
         logging.debug("Failed to send notification: %s", exc)
 
 
+# ---------------------------------------------------------------------------
+# Config file parsing
+# ---------------------------------------------------------------------------
+
+# (config_path, mtime_ns, parsed data) of the last config.json read
+_config_cache = (None, None, None)
+
+
+def _get_config(config_path):
+    """Return the parsed config.json, reparsing only when its mtime changes.
+
+    Shared by the load_*_config() helpers so a start or reload parses the
+    file once. Raises OSError or ValueError like open()/json.loads().
+    """
+    global _config_cache
+    mtime = os.stat(config_path).st_mtime_ns
+    cached_path, cached_mtime, data = _config_cache
+    if cached_path == config_path and cached_mtime == mtime:
+        return data
+    with open(config_path, "rb") as f:
+        raw = f.read()
+    data = _loads(raw)
+    _config_cache = (config_path, mtime, data)
+    return data
+
+
+# Top-level config.json keys the companion reads: key -> (type, default),
+# or (int, default, (min, max)). Missing or wrongly-typed values (and empty
+# strings) fall back to the default; int values are coerced with int() and
+# clamped to their range, bool values present in the file with bool().
+_CONFIG_SCHEMA = {
+    "net_interface":         (str, None),
+    "disk_device":           (str, None),
+    "disk_mount":            (str, "/"),
+    "proc_update_interval":  (int, 30, (1, 60)),
+    "stats_header":          (list, ()),
+    "active_profile_name":   (str, ""),
+    "profiles":              (list, ()),
+    "notifications_enabled": (bool, False),
+    "notification_filter":   (list, ()),
+    "follow_lock":           (bool, True),
+    # hidapi caps the input report queue at 1024
+    "input_report_buffer":   (int, 128, (1, 1024)),
+}
+
+# (parsed data, validated settings) for the last _get_settings() call
+_settings_cache = (None, None)
+
+
+def _parse_config(data):
+    """Apply _CONFIG_SCHEMA to a parsed config.json, returning a dict with
+    every schema key present and correctly typed."""
+    if not isinstance(data, dict):
+        data = {}
+    settings = {}
+    for key, (kind, default, *limits) in _CONFIG_SCHEMA.items():
+        value = data.get(key)
+        if kind is int:
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                value = default
+            if limits:
+                low, high = limits[0]
+                value = max(low, min(high, value))
+        elif kind is bool:
+            value = bool(value) if key in data else default
+        elif not isinstance(value, kind) or (kind is str and not value):
+            value = default
+        settings[key] = value
+    return settings
+
+
+def _get_settings(config_path):
+    """Return the validated top-level settings of config.json.
+
+    Validation runs once per parse of the file, not once per loader.
+    Raises OSError or ValueError like _get_config().
+    """
+    global _settings_cache
+    data = _get_config(config_path)
+    cached_data, settings = _settings_cache
+    if cached_data is not data:
+        settings = _parse_config(data)
+        _settings_cache = (data, settings)
+    return settings
+
+
 # ---------------------------------------------------------------------------
 # Notification config loading
 # ---------------------------------------------------------------------------
@@ -439,13 +618,9 @@ def load_notification_config(config_path=None):
     """
     if config_path and os.path.isfile(config_path):
         try:
-            with open(config_path, "r") as f:
-                data = json.load(f)
-            enabled = data.get("notifications_enabled", False)
-            filter_list = data.get("notification_filter", [])
-            if isinstance(filter_list, list):
-                return enabled, set(str(s) for s in filter_list)
-        except (json.JSONDecodeError, IOError) as exc:
+            cfg = _get_settings(config_path)
+            return cfg["notifications_enabled"], set(map(str, cfg["notification_filter"]))
+        except (ValueError, IOError) as exc:
             logging.warning("Failed to load notification config: %s", exc)
     return False, set()
 
@@ -454,55 +629,21 @@ def load_follow_lock_config(config_path=None):
     """Load follow_lock setting from config.json. Default True."""
     if config_path and os.path.isfile(config_path):
         try:
-            with open(config_path, "r") as f:
-                data = json.load(f)
-            return bool(data.get("follow_lock", True))
-        except (json.JSONDecodeError, IOError):
+            return _get_settings(config_path)["follow_lock"]
+        except (ValueError, IOError):
             pass
     return True
 
 
-# ---------------------------------------------------------------------------
-# Vendor HID read thread
-# ---------------------------------------------------------------------------
-
-def _vendor_read_thread(device, hid_lock, config_mgr):
-    """Background thread: reads vendor HID input reports from bridge."""
-    global running
-    while running:
+def load_input_report_buffer_config(config_path=None):
+    """Load input_report_buffer (HID input reports to queue host-side).
+    Default 128."""
+    if config_path and os.path.isfile(config_path):
         try:
-            with hid_lock:
-                data = device.read(63, timeout=100)
-            if data and len(data) >= 4:
-                # data[0] is the HID report ID (0x06), actual payload starts at data[1]
-                msg_type = data[1]
-                if msg_type == MSG_BUTTON_PRESS:
-                    page_idx = data[2]
-                    widget_idx = data[3]
-                    logging.info("Button press: page=%d widget=%d", page_idx, widget_idx)
-                    # Execute action on a separate thread to avoid blocking reads
-                    threading.Thread(
-                        target=execute_action,
-                        args=(config_mgr, page_idx, widget_idx),
-                        daemon=True
-                    ).start()
-                elif msg_type == MSG_DDC_CMD and len(data) >= 8:
-                    vcp_code = data[2]
-                    value = struct.unpack_from('<H', bytes(data), 3)[0]
-                    adjustment = struct.unpack_from('<h', bytes(data), 5)[0]
-                    display_num = data[7]
-                    logging.info("DDC cmd: vcp=0x%02X val=%d adj=%d disp=%d",
-                                 vcp_code, value, adjustment, display_num)
-                    threading.Thread(
-                        target=execute_ddc_direct,
-                        args=(vcp_code, value, adjustment, display_num),
-                        daemon=True
-                    ).start()
-        except (IOError, OSError):
-            logging.warning("Vendor HID read error, device may have disconnected")
-            break
-        except Exception as exc:
-            logging.debug("Vendor read thread error: %s", exc)
+            return _get_settings(config_path)["input_report_buffer"]
+        except (ValueError, IOError):
+            pass
+    return 128
 
 
 # ---------------------------------------------------------------------------
@@ -519,17 +660,36 @@ def _start_config_watcher(config_path, config_mgr):
                        "Install with: pip install watchdog")
         return None
 
+    # Resolved once; the watched directory is absolute, so inotify event
+    # paths are too and compare directly
+    target_path = os.path.abspath(config_path)
+
     class ConfigReloadHandler(FileSystemEventHandler):
+        """Debounces modify events: each one pushes a monotonic deadline
+        back, and a single worker thread reloads once it passes."""
+
         def __init__(self):
-            self._timer = None
             self._debounce_sec = 0.5
+            self._deadline = 0.0
+            self._pending = threading.Event()
+            self._worker = None
 
         def on_modified(self, event):
-            if os.path.abspath(event.src_path) == os.path.abspath(config_path):
-                if self._timer:
-                    self._timer.cancel()
-                self._timer = threading.Timer(self._debounce_sec, self._reload)
-                self._timer.start()
+            if event.src_path == target_path:
+                self._deadline = time.monotonic() + self._debounce_sec
+                self._pending.set()
+                if self._worker is None:
+                    self._worker = threading.Thread(target=self._debounce_loop, daemon=True)
+                    self._worker.start()
+
+        def _debounce_loop(self):
+            while True:
+                self._pending.wait()
+                # Events arriving while we sleep just move the deadline
+                while (remaining := self._deadline - time.monotonic()) > 0:
+                    time.sleep(remaining)
+                self._pending.clear()
+                self._reload()
 
         def _reload(self):
             if config_mgr.load_json_file(config_path):
@@ -539,7 +699,7 @@ def _start_config_watcher(config_path, config_mgr):
 
     observer = Observer()
     handler = ConfigReloadHandler()
-    observer.schedule(handler, os.path.dirname(os.path.abspath(config_path)), recursive=False)
+    observer.schedule(handler, os.path.dirname(target_path), recursive=False)
     observer.daemon = True
     observer.start()
     logging.info("Config file watcher started for %s", config_path)
@@ -550,24 +710,24 @@ def _start_config_watcher(config_path, config_mgr):
 # Power state and time sync helpers
 # ---------------------------------------------------------------------------
 
-def send_power_state(device, state, hid_lock=None):
+def send_power_state(device, state):
     """Send a MSG_POWER_STATE message to the bridge.
 
     Packet: [0x00 report ID] [0x05 MSG_POWER_STATE] [state byte]
     """
+    if state < len(_POWER_STATE_PACKETS):
+        packet = _POWER_STATE_PACKETS[state]
+    else:
+        packet = _POWER_STATE_PACKET.pack(HID_REPORT_ID, MSG_POWER_STATE, state)
     try:
-        if hid_lock:
-            with hid_lock:
-                device.write(b"\x06" + bytes([MSG_POWER_STATE, state]))
-        else:
-            device.write(b"\x06" + bytes([MSG_POWER_STATE, state]))
-        state_names = {POWER_SHUTDOWN: "SHUTDOWN", POWER_WAKE: "WAKE", POWER_LOCKED: "LOCKED"}
-        logging.info("Sent power state: %s", state_names.get(state, f"0x{state:02X}"))
+        device.write(packet)
+        logging.info("Sent power state: %s", _POWER_STATE_NAMES[state]
+                     if state < len(_POWER_STATE_NAMES) else f"0x{state:02X}")
     except (IOError, OSError) as exc:
         logging.warning("Failed to send power state: %s", exc)
 
 
-def send_time_sync(device, hid_lock=None):
+def send_time_sync(device):
     """Send a MSG_TIME_SYNC message with current epoch seconds and timezone offset.
 
     Packet: [0x00 report ID] [0x06 MSG_TIME_SYNC] [uint32 LE epoch] [int16 LE tz_offset_min]
@@ -577,13 +737,9 @@ def send_time_sync(device, hid_lock=None):
     # Get local UTC offset in minutes
     local_dt = datetime.datetime.now(datetime.timezone.utc).astimezone()
     tz_offset_min = int(local_dt.utcoffset().total_seconds() // 60)
-    payload = struct.pack("<Ih", epoch, tz_offset_min)
+    packet = _TIME_SYNC_PACKET.pack(HID_REPORT_ID, MSG_TIME_SYNC, epoch, tz_offset_min)
     try:
-        if hid_lock:
-            with hid_lock:
-                device.write(b"\x06" + bytes([MSG_TIME_SYNC]) + payload)
-        else:
-            device.write(b"\x06" + bytes([MSG_TIME_SYNC]) + payload)
+        device.write(packet)
     except (IOError, OSError) as exc:
         logging.debug("Failed to send time sync: %s", exc)
 
@@ -592,18 +748,32 @@ def send_time_sync(device, hid_lock=None):
 # GPU stats collector
 # ---------------------------------------------------------------------------
 
+# Indices of GPUCollector.collect_all()'s result tuple
+GPU_ALL_FIELDS = frozenset(range(5))
+
+
 class GPUCollector:
-    """Collects GPU utilization and temperature.
+    """Collects GPU utilization, temperature, memory, power and clock.
 
-    Tries NVIDIA (pynvml) first, then AMD (sysfs). If neither is
-    available, returns 0xFF for both metrics.
+    Tries NVIDIA (pynvml, then nvidia-smi) first, then AMD (sysfs). If
+    none is available, collect_all() returns the "unavailable" values.
     """
 
     def __init__(self):
         self.gpu_type = None  # 'nvidia', 'amd', or None
         self._nvml_handle = None
+        # NVML entry points and constants, bound once in _init_nvidia
+        self._nvml_util = None
+        self._nvml_temp = None
+        self._nvml_mem = None
+        self._nvml_power = None
+        self._nvml_clock = None
+        self._nvml_temperature_gpu = None
+        self._nvml_clock_graphics = None
         self._amd_gpu_busy_path = None
         self._amd_temp_path = None
+        self._amd_busy_fd = None
+        self._amd_temp_fd = None
         self._init_nvidia()
         if self.gpu_type is None:
             self._init_amd()
@@ -611,18 +781,28 @@ class GPUCollector:
             logging.info("No GPU detected -- gpu_percent and gpu_temp will be 0xFF")
 
     def _init_nvidia(self):
+        if _pynvml is None:
+            logging.debug("pynvml not installed, trying nvidia-smi fallback")
+            self._init_nvidia_smi()
+            return
         try:
-            import pynvml
+            pynvml = _pynvml
             pynvml.nvmlInit()
             self._nvml_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
             name = pynvml.nvmlDeviceGetName(self._nvml_handle)
             if isinstance(name, bytes):
                 name = name.decode()
+            atexit.register(self.close)  # Unregistered again by close()
+            # Bind the entry points and constants once for the per-tick reads
+            self._nvml_util = pynvml.nvmlDeviceGetUtilizationRates
+            self._nvml_temp = pynvml.nvmlDeviceGetTemperature
+            self._nvml_mem = pynvml.nvmlDeviceGetMemoryInfo
+            self._nvml_power = pynvml.nvmlDeviceGetPowerUsage
+            self._nvml_clock = pynvml.nvmlDeviceGetClockInfo
+            self._nvml_temperature_gpu = pynvml.NVML_TEMPERATURE_GPU
+            self._nvml_clock_graphics = pynvml.NVML_CLOCK_GRAPHICS
             logging.info("NVIDIA GPU detected (pynvml): %s", name)
             self.gpu_type = "nvidia"
-        except ImportError:
-            logging.debug("pynvml not installed, trying nvidia-smi fallback")
-            self._init_nvidia_smi()
         except Exception as exc:
             logging.debug("NVIDIA pynvml init failed: %s, trying nvidia-smi", exc)
             self._init_nvidia_smi()
@@ -658,124 +838,161 @@ class GPUCollector:
                     if os.path.isfile(temp_path):
                         self._amd_temp_path = temp_path
                         break
+            # Keep the sysfs attributes open; each tick is then a single pread()
+            self._amd_busy_fd = self._open_amd_attr(gpu_busy)
+            self._amd_temp_fd = self._open_amd_attr(self._amd_temp_path)
+            atexit.register(self.close)  # Unregistered again by close()
             logging.info("AMD GPU detected (sysfs)")
             self.gpu_type = "amd"
 
-    def collect(self):
-        """Return (gpu_percent, gpu_temp) as ints. 0xFF if unavailable."""
+    @staticmethod
+    def _open_amd_attr(path):
+        if path is None:
+            return None
+        try:
+            return os.open(path, os.O_RDONLY)
+        except OSError as exc:
+            logging.debug("Cannot open AMD sysfs file %s: %s", path, exc)
+            return None
+
+    def close(self):
+        """Release the kept-open sysfs fds, or this collector's NVML init.
+        Later collect_all() calls report every value as unavailable rather
+        than reopening them.
+
+        Called from CompanionService.stop(); the atexit hook registered at
+        init is dropped here, so restarted services don't accumulate hooks
+        (or keep old collectors alive through them).
+        """
+        atexit.unregister(self.close)
+        if self.gpu_type == "nvidia" and self._nvml_handle is not None:
+            self.gpu_type = None
+            self._nvml_handle = None
+            try:
+                _pynvml.nvmlShutdown()
+            except Exception as exc:
+                logging.debug("nvmlShutdown failed: %s", exc)
+        elif self.gpu_type == "amd":
+            self.gpu_type = None
+        for fd in (self._amd_busy_fd, self._amd_temp_fd):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._amd_busy_fd = None
+        self._amd_temp_fd = None
+
+    def collect_all(self, fields=GPU_ALL_FIELDS):
+        """Return (gpu_percent, gpu_temp, gpu_mem_pct, gpu_power_w, gpu_freq_mhz).
+
+        All GPU metrics are gathered in one pass: one block of NVML calls
+        or a single nvidia-smi invocation. Unavailable values are 0xFF for
+        percent/temp and 0 for power/clock. fields is the set of result
+        indices the caller uses; NVML is only queried for those, and the
+        others are reported as unavailable.
+        """
         if self.gpu_type == "nvidia":
-            return self._collect_nvidia()
+            return self._collect_nvidia(fields)
         elif self.gpu_type == "nvidia-smi":
             return self._collect_nvidia_smi()
         elif self.gpu_type == "amd":
-            return self._collect_amd()
-        return (0xFF, 0xFF)
+            return self._collect_amd() + (0xFF, 0, 0)
+        return (0xFF, 0xFF, 0xFF, 0, 0)
 
-    def _collect_nvidia(self):
+    def _collect_nvidia(self, fields):
+        handle = self._nvml_handle
+        gpu_pct = gpu_temp = gpu_mem_pct = 0xFF
+        gpu_power_w = gpu_freq_mhz = 0
         try:
-            import pynvml
-            util = pynvml.nvmlDeviceGetUtilizationRates(self._nvml_handle)
-            temp = pynvml.nvmlDeviceGetTemperature(
-                self._nvml_handle, pynvml.NVML_TEMPERATURE_GPU
-            )
-            return (min(int(util.gpu), 100), min(int(temp), 254))
+            if 0 in fields:
+                gpu_pct = min(int(self._nvml_util(handle).gpu), 100)
+            if 1 in fields:
+                temp = self._nvml_temp(handle, self._nvml_temperature_gpu)
+                gpu_temp = min(int(temp), 254)
         except Exception as exc:
             logging.debug("NVIDIA read failed: %s", exc)
-            return (0xFF, 0xFF)
-
-    def _collect_nvidia_smi(self):
-        """Collect GPU stats via nvidia-smi subprocess."""
-        import subprocess
-        try:
-            result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=utilization.gpu,temperature.gpu",
-                 "--format=csv,noheader,nounits"],
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                parts = result.stdout.strip().split(',')
-                gpu_pct = min(int(parts[0].strip()), 100)
-                gpu_temp = min(int(parts[1].strip()), 254)
-                return (gpu_pct, gpu_temp)
-        except Exception as exc:
-            logging.debug("nvidia-smi collect failed: %s", exc)
-        return (0xFF, 0xFF)
-
-    def _collect_amd(self):
-        gpu_percent = 0xFF
-        gpu_temp = 0xFF
-        try:
-            with open(self._amd_gpu_busy_path) as f:
-                gpu_percent = min(int(f.read().strip()), 100)
-        except Exception:
-            pass
-        if self._amd_temp_path:
+            return (0xFF, 0xFF, 0xFF, 0, 0)
+        if 2 in fields:
             try:
-                with open(self._amd_temp_path) as f:
-                    # sysfs reports millidegrees
-                    gpu_temp = min(int(f.read().strip()) // 1000, 254)
-            except Exception:
-                pass
-        return (gpu_percent, gpu_temp)
-
-    def collect_extended(self):
-        """Return (gpu_mem_pct, gpu_power_w, gpu_freq_mhz) for NVIDIA GPUs.
-
-        Returns (0xFF, 0, 0) if not NVIDIA or on error.
-        """
-        if self.gpu_type == "nvidia-smi":
-            return self._collect_extended_nvidia_smi()
-        if self.gpu_type != "nvidia":
-            return (0xFF, 0, 0)
-        try:
-            import pynvml
-            # GPU memory
-            mem = pynvml.nvmlDeviceGetMemoryInfo(self._nvml_handle)
-            gpu_mem_pct = min(int(mem.used * 100 / mem.total), 100) if mem.total > 0 else 0xFF
-            # GPU power
+                mem = self._nvml_mem(handle)
+                gpu_mem_pct = min(int(mem.used * 100 / mem.total), 100) if mem.total > 0 else 0xFF
+            except Exception as exc:
+                logging.debug("NVIDIA memory read failed: %s", exc)
+        if 3 in fields:
             try:
-                power_mw = pynvml.nvmlDeviceGetPowerUsage(self._nvml_handle)
+                power_mw = self._nvml_power(handle)
                 gpu_power_w = min(int(power_mw / 1000), 0xFFFF)
             except Exception:
-                gpu_power_w = 0
-            # GPU clock
+                pass
+        if 4 in fields:
             try:
-                clock = pynvml.nvmlDeviceGetClockInfo(self._nvml_handle, pynvml.NVML_CLOCK_GRAPHICS)
+                clock = self._nvml_clock(handle, self._nvml_clock_graphics)
                 gpu_freq_mhz = min(int(clock), 0xFFFF)
             except Exception:
-                gpu_freq_mhz = 0
-            return (gpu_mem_pct, gpu_power_w, gpu_freq_mhz)
-        except Exception as exc:
-            logging.debug("NVIDIA extended stats failed: %s", exc)
-            return (0xFF, 0, 0)
+                pass
+        return (gpu_pct, gpu_temp, gpu_mem_pct, gpu_power_w, gpu_freq_mhz)
 
-    def _collect_extended_nvidia_smi(self):
-        """Collect extended GPU stats via nvidia-smi subprocess."""
+    def _collect_nvidia_smi(self):
+        """Collect all GPU stats with a single nvidia-smi subprocess."""
         import subprocess
         try:
             result = subprocess.run(
                 ["nvidia-smi",
-                 "--query-gpu=memory.used,memory.total,power.draw,clocks.gr",
+                 "--query-gpu=utilization.gpu,temperature.gpu,memory.used,"
+                 "memory.total,power.draw,clocks.gr",
                  "--format=csv,noheader,nounits"],
                 capture_output=True, text=True, timeout=5
             )
             if result.returncode == 0 and result.stdout.strip():
-                parts = result.stdout.strip().split(',')
-                mem_used = float(parts[0].strip())
-                mem_total = float(parts[1].strip())
-                gpu_mem_pct = min(int(mem_used * 100 / mem_total), 100) if mem_total > 0 else 0xFF
+                parts = result.stdout.strip().split('\n')[0].split(',')
+                gpu_pct = min(int(parts[0].strip()), 100)
+                gpu_temp = min(int(parts[1].strip()), 254)
                 try:
-                    gpu_power_w = min(int(float(parts[2].strip())), 0xFFFF)
+                    mem_used = float(parts[2].strip())
+                    mem_total = float(parts[3].strip())
+                    gpu_mem_pct = min(int(mem_used * 100 / mem_total), 100) if mem_total > 0 else 0xFF
+                except (ValueError, IndexError):
+                    gpu_mem_pct = 0xFF
+                try:
+                    gpu_power_w = min(int(float(parts[4].strip())), 0xFFFF)
                 except (ValueError, IndexError):
                     gpu_power_w = 0
                 try:
-                    gpu_freq_mhz = min(int(float(parts[3].strip())), 0xFFFF)
+                    gpu_freq_mhz = min(int(float(parts[5].strip())), 0xFFFF)
                 except (ValueError, IndexError):
                     gpu_freq_mhz = 0
-                return (gpu_mem_pct, gpu_power_w, gpu_freq_mhz)
+                return (gpu_pct, gpu_temp, gpu_mem_pct, gpu_power_w, gpu_freq_mhz)
         except Exception as exc:
-            logging.debug("nvidia-smi extended stats failed: %s", exc)
-        return (0xFF, 0, 0)
+            logging.debug("nvidia-smi collect failed: %s", exc)
+        return (0xFF, 0xFF, 0xFF, 0, 0)
+
+    def _collect_amd(self):
+        gpu_percent = 0xFF
+        gpu_temp = 0xFF
+        if self._amd_busy_fd is None:
+            self._amd_busy_fd = self._open_amd_attr(self._amd_gpu_busy_path)
+        if self._amd_busy_fd is not None:
+            try:
+                gpu_percent = min(int(os.pread(self._amd_busy_fd, 16, 0)), 100)
+            except ValueError:
+                pass
+            except OSError:
+                # fd went stale (GPU reset / driver reload); reopen next tick
+                os.close(self._amd_busy_fd)
+                self._amd_busy_fd = None
+        if self._amd_temp_fd is None:
+            self._amd_temp_fd = self._open_amd_attr(self._amd_temp_path)
+        if self._amd_temp_fd is not None:
+            try:
+                # sysfs reports millidegrees
+                gpu_temp = min(int(os.pread(self._amd_temp_fd, 16, 0)) // 1000, 254)
+            except ValueError:
+                pass
+            except OSError:
+                os.close(self._amd_temp_fd)
+                self._amd_temp_fd = None
+        return (gpu_percent, gpu_temp)
 
 
 # ---------------------------------------------------------------------------
@@ -793,8 +1010,10 @@ def find_bridge():
         logging.debug("No devices found with VID=0x%04X PID=0x%04X", VENDOR_ID, PRODUCT_ID)
         return None
 
-    logging.debug("Found %d HID interface(s) for VID=0x%04X PID=0x%04X:",
-                  len(devices), VENDOR_ID, PRODUCT_ID)
+    debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+    if debug:
+        logging.debug("Found %d HID interface(s) for VID=0x%04X PID=0x%04X:",
+                      len(devices), VENDOR_ID, PRODUCT_ID)
 
     vendor_path = None
     fallback_path = None
@@ -803,8 +1022,9 @@ def find_bridge():
         product = dev.get("product_string", "")
         usage_page = dev.get("usage_page", 0)
         path = dev.get("path", b"")
-        logging.debug("  path=%s product=%s usage_page=0x%04X usage=0x%04X",
-                      path, product, usage_page, dev.get("usage", 0))
+        if debug:
+            logging.debug("  path=%s product=%s usage_page=0x%04X usage=0x%04X",
+                          path, product, usage_page, dev.get("usage", 0))
 
         if product != PRODUCT_STRING:
             continue
@@ -815,32 +1035,279 @@ def find_bridge():
         elif fallback_path is None:
             fallback_path = path
 
-    chosen = vendor_path or fallback_path
-    if chosen:
-        logging.info("Bridge found at path: %s", chosen)
-    else:
-        logging.debug("No matching product string '%s' found", PRODUCT_STRING)
-    return chosen
+    chosen = vendor_path or fallback_path
+    if chosen:
+        logging.info("Bridge found at path: %s", chosen)
+    else:
+        logging.debug("No matching product string '%s' found", PRODUCT_STRING)
+    return chosen
+
+
+def _set_input_report_buffer(device, size):
+    """Ask hidapi to queue up to `size` input reports for this device, so
+    button presses aren't dropped while the reader is briefly busy.
+
+    Only newer hidapi builds expose hid_set_input_report_buffer_size (and only
+    some backends honour it); otherwise the backend default is kept.
+    """
+    setter = getattr(device, "set_input_report_buffer_size", None)
+    if setter is None:
+        logging.debug("hidapi has no set_input_report_buffer_size, keeping default queue")
+        return
+    try:
+        setter(size)
+        logging.info("HID input report buffer set to %d reports", size)
+    except Exception as exc:
+        logging.debug("Cannot set HID input report buffer: %s", exc)
+
+
+def _open_hidraw_monitor():
+    """Return a started pyudev monitor for hidraw hotplug events, or None
+    if udev is unavailable (pyudev not installed, or not Linux).
+
+    Started before the bridge scan so a device plugged in between the scan
+    and the wait is still seen.
+    """
+    try:
+        import pyudev
+    except ImportError:
+        logging.debug("pyudev not installed -- polling for the bridge every %.0fs",
+                      RETRY_INTERVAL)
+        return None
+    try:
+        monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+        monitor.filter_by("hidraw")
+        monitor.start()
+        return monitor
+    except Exception as exc:
+        logging.debug("udev monitor unavailable: %s", exc)
+        return None
+
+
+def _open_hid_path(path):
+    """Open a HID device by path with whichever hidapi binding is installed."""
+    if hasattr(hid, 'Device'):
+        return hid.Device(path=path)
+    device = hid.device()
+    device.open_path(path)
+    return device
+
+
+def _product_string(device):
+    """Product string of an open device, for either hidapi binding."""
+    if hasattr(device, 'get_product_string'):
+        return device.get_product_string() or ''
+    return getattr(device, 'product', '') or ''
+
+
+def open_bridge():
+    """Open the HotkeyBridge, trying the last known-good path first.
+
+    Only falls back to a full find_bridge() enumeration when the cached
+    path is unset, fails to open, or now belongs to a different device
+    (hidraw nodes are reused after re-enumeration). Returns the open
+    device, or None if no bridge is present. Raises if the bridge is found
+    but cannot be opened.
+    """
+    global _last_bridge_path
+    if _last_bridge_path is not None:
+        device = None
+        try:
+            device = _open_hid_path(_last_bridge_path)
+            product = _product_string(device)
+            if product == PRODUCT_STRING:
+                return device
+            logging.debug("Cached bridge path %s is now %r, rescanning",
+                          _last_bridge_path, product)
+        except Exception as exc:
+            logging.debug("Cached bridge path %s failed: %s", _last_bridge_path, exc)
+        if device is not None:
+            try:
+                device.close()
+            except Exception:
+                pass
+        _last_bridge_path = None
+
+    path = find_bridge()
+    if path is None:
+        return None
+    device = _open_hid_path(path)
+    _last_bridge_path = path
+    return device
+
+
+# ---------------------------------------------------------------------------
+# CPU temperature
+# ---------------------------------------------------------------------------
+
+HWMON_DIR = "/sys/class/hwmon"
+
+# Preferred CPU temperature drivers, in priority order
+CPU_TEMP_SENSORS = ("coretemp", "k10temp", "zenpower", "acpitz")
+
+THERMAL_DIR = "/sys/class/thermal"
+
+# Thermal zone types that track the CPU (Intel package, ARM SoCs), used
+# when no hwmon driver above is present
+CPU_THERMAL_ZONES = ("x86_pkg_temp", "cpu-thermal", "cpu_thermal", "soc_thermal")
+
+# psutil sensor APIs are platform-dependent; probe once instead of catching
+# AttributeError on every tick. The battery and fan flags are also cleared
+# the first time psutil reports no such hardware, since a battery or fan
+# doesn't appear while we run.
+_HAS_SENSORS_TEMPERATURES = hasattr(psutil, "sensors_temperatures")
+_HAS_SENSORS_FANS = hasattr(psutil, "sensors_fans")
+_HAS_SENSORS_BATTERY = hasattr(psutil, "sensors_battery")
+
+
+def _resolve_hwmon_input(prefix, names=None):
+    """Return the path of the first <prefix>N_input file under /sys/class/hwmon.
+
+    With names, only hwmon devices whose driver name is listed are
+    considered, in the given priority order. Without, the lowest-numbered
+    hwmon device that has a matching input wins. Returns None if nothing
+    matches.
+    """
+    try:
+        entries = sorted(os.listdir(HWMON_DIR), key=lambda e: (len(e), e))
+    except OSError:
+        return None
+    candidates = {}
+    for entry in entries:
+        base = os.path.join(HWMON_DIR, entry)
+        try:
+            with open(os.path.join(base, "name")) as f:
+                name = f.read().strip()
+            inputs = sorted(
+                (f for f in os.listdir(base)
+                 if f.startswith(prefix) and f.endswith("_input")),
+                key=lambda f: (len(f), f))
+        except OSError:
+            continue
+        if not inputs:
+            continue
+        path = os.path.join(base, inputs[0])
+        if names is None:
+            return path
+        candidates.setdefault(name, path)
+    for name in names or ():
+        if name in candidates:
+            return candidates[name]
+    return None
+
+
+def _resolve_thermal_zone(prefix, names):
+    """Return the temp file of the first thermal zone whose type is listed
+    in names, in the given priority order, or None."""
+    try:
+        entries = [e for e in os.listdir(THERMAL_DIR) if e.startswith(prefix)]
+    except OSError:
+        return None
+    zones = {}
+    for entry in sorted(entries, key=lambda e: (len(e), e)):
+        base = os.path.join(THERMAL_DIR, entry)
+        try:
+            with open(os.path.join(base, "type")) as f:
+                zones.setdefault(f.read().strip(), os.path.join(base, "temp"))
+        except OSError:
+            continue
+    for name in names:
+        if name in zones:
+            return zones[name]
+    return None
+
+
+class _HwmonInput:
+    """A hwmon *_input attribute (or, with another resolve function, any
+    integer sysfs attribute) resolved once, then read with a single pread().
+
+    Resolution happens on the first read(); if no matching sysfs file
+    exists, read() returns None and callers fall back to psutil. A read
+    error (driver reload renumbers hwmon devices) drops the fd and
+    resolves again on the next read().
+    """
+
+    def __init__(self, prefix, names=None, resolve=_resolve_hwmon_input):
+        self._prefix = prefix
+        self._names = names
+        self._resolve = resolve
+        self._fd = None
+        self._resolved = False
+        atexit.register(self.close)
+
+    def close(self):
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
+    def read(self):
+        """Return the raw integer value, or None if unavailable."""
+        if not self._resolved:
+            self._resolved = True
+            path = self._resolve(self._prefix, self._names)
+            if path:
+                try:
+                    self._fd = os.open(path, os.O_RDONLY)
+                    logging.info("Reading %s from %s", self._prefix, path)
+                except OSError as exc:
+                    logging.debug("Cannot open %s: %s", path, exc)
+        if self._fd is None:
+            return None
+        try:
+            return int(os.pread(self._fd, 16, 0))
+        except ValueError:
+            return None
+        except OSError as exc:
+            logging.debug("%s input read failed (%s), re-resolving", self._prefix, exc)
+            self.close()
+            self._resolved = False
+            return None
+
+
+_cpu_temp_input = _HwmonInput("temp", CPU_TEMP_SENSORS)
+_cpu_zone_input = _HwmonInput("thermal_zone", CPU_THERMAL_ZONES, _resolve_thermal_zone)
+_fan_input = _HwmonInput("fan")
 
 
-# ---------------------------------------------------------------------------
-# CPU temperature
-# ---------------------------------------------------------------------------
+# psutil sensors_temperatures() key chosen by the first successful fallback
+# lookup; the sensor topology doesn't change while we run
+_cpu_temp_sensor = None
+
 
 def get_cpu_temp():
-    """Read CPU temperature from psutil. Returns int Celsius or 0xFF."""
+    """Read CPU temperature. Returns int Celsius or 0xFF.
+
+    Uses the pre-resolved hwmon sysfs file when available, then a CPU
+    thermal zone, psutil otherwise.
+    """
+    global _cpu_temp_sensor
+    millideg = _cpu_temp_input.read()
+    if millideg is None:
+        millideg = _cpu_zone_input.read()
+    if millideg is not None:
+        return min(millideg // 1000, 254)
+    if not _HAS_SENSORS_TEMPERATURES:
+        return 0xFF
     try:
         temps = psutil.sensors_temperatures()
         if not temps:
             return 0xFF
-        for name in ("coretemp", "k10temp", "zenpower", "acpitz"):
-            if name in temps:
-                entries = temps[name]
-                if entries:
-                    return min(int(entries[0].current), 254)
+        if _cpu_temp_sensor is not None:
+            try:
+                return min(int(temps[_cpu_temp_sensor][0].current), 254)
+            except (KeyError, IndexError):
+                _cpu_temp_sensor = None
+        for name in CPU_TEMP_SENSORS:
+            if temps.get(name):
+                _cpu_temp_sensor = name
+                return min(int(temps[name][0].current), 254)
         # Fall back to first available sensor
-        for sensor_list in temps.values():
+        for name, sensor_list in temps.items():
             if sensor_list:
+                _cpu_temp_sensor = name
                 return min(int(sensor_list[0].current), 254)
     except Exception:
         pass
@@ -851,24 +1318,32 @@ def get_cpu_temp():
 # TLV encoding
 # ---------------------------------------------------------------------------
 
-def encode_stats_tlv(stats_list):
+def encode_stats_tlv(stats_list, header=b""):
     """Encode a list of (stat_type_id, value) pairs into TLV packet bytes.
 
     Format: [count] [type1][len1][val1...] [type2][len2][val2...] ...
     Values < 256 use 1 byte, values >= 256 use 2 bytes (little-endian).
+    header (e.g. _HDR_STATS) is written in front of the count byte, so the
+    caller doesn't have to copy the packet again to prefix it.
     """
-    packet = bytearray([len(stats_list)])
+    # Collect the packet as a flat list of byte values and convert it in one
+    # bytes() call; 2-byte values are split into LE lo/hi here.
+    packet = [*header, len(stats_list)]
     for stat_type, value in stats_list:
-        packet.append(stat_type)
         if value < 256:
-            packet.append(1)
-            packet.append(value & 0xFF)
+            packet += (stat_type, 1, value & 0xFF)
         else:
-            packet.append(2)
-            packet.extend(struct.pack('<H', value & 0xFFFF))
+            packet += (stat_type, 2, value & 0xFF, (value >> 8) & 0xFF)
     return bytes(packet)
 
 
+try:
+    # Compiled drop-in replacement, if built (see _tlv.pyx)
+    from companion._tlv import encode_stats_tlv
+except ImportError:
+    pass
+
+
 # ---------------------------------------------------------------------------
 # Stats config loading
 # ---------------------------------------------------------------------------
@@ -897,29 +1372,22 @@ def load_stats_config(config_path=None):
 
     if config_path and os.path.isfile(config_path):
         try:
-            with open(config_path, "r") as f:
-                data = json.load(f)
-            net_interface = data.get("net_interface") or None
-            disk_device = data.get("disk_device") or None
-            disk_mount = data.get("disk_mount") or "/"
-            proc_update_interval = max(1, min(60, int(data.get("proc_update_interval", 30))))
+            cfg = _get_settings(config_path)
+            net_interface = cfg["net_interface"]
+            disk_device = cfg["disk_device"]
+            disk_mount = cfg["disk_mount"]
+            proc_update_interval = cfg["proc_update_interval"]
 
             # Collect stat types from stats_header
-            type_set = set()
-            stats_header = data.get("stats_header")
-            if stats_header and isinstance(stats_header, list):
-                for s in stats_header:
-                    if isinstance(s, dict):
-                        t = s.get("type", 0)
-                        if 1 <= t <= 0x17:
-                            type_set.add(t)
+            type_set = {t for s in cfg["stats_header"]
+                        if isinstance(s, dict) and 1 <= (t := s.get("type", 0)) <= 0x17}
 
             # Also scan all widget pages for stat_monitor widgets (widget_type == 1)
             # to ensure the companion sends data for any stat type used on the display
             WIDGET_STAT_MONITOR = 1
             STAT_DISPLAY_UPTIME = 0x15  # Display-local, no companion data needed
-            active_name = data.get("active_profile_name", "")
-            for profile in data.get("profiles", []):
+            active_name = cfg["active_profile_name"]
+            for profile in cfg["profiles"]:
                 if profile.get("name") != active_name:
                     continue
                 for page in profile.get("pages", []):
@@ -933,21 +1401,245 @@ def load_stats_config(config_path=None):
                 type_ids = sorted(type_set)
                 logging.info("Loaded %d stat types from config: %s",
                              len(type_ids),
-                             [STAT_ID_TO_NAME.get(t, f"0x{t:02X}") for t in type_ids])
+                             [STAT_ID_TO_NAME[t] for t in type_ids])
                 return (type_ids, net_interface, disk_device, disk_mount, proc_update_interval)
-        except (json.JSONDecodeError, IOError, KeyError) as exc:
+        except (ValueError, IOError, KeyError) as exc:
             logging.warning("Failed to load stats config: %s", exc)
 
     # Default: original 8 stats
     return ([s["type"] for s in DEFAULT_STATS_CONFIG], net_interface, disk_device, disk_mount, proc_update_interval)
 
 
+# ---------------------------------------------------------------------------
+# Direct /proc readers (Linux fast path; psutil is the fallback)
+# ---------------------------------------------------------------------------
+
+_proc_fds = {}
+_proc_snapshot = None   # {path: bytes} while a stats tick is being collected
+_prev_cpu_times = None  # (busy, total) jiffies from the previous sample
+_boot_time = None       # psutil.boot_time(), for the non-/proc uptime fallback
+_cpufreq_fds = None     # kept-open scaling_cur_freq fds, one per cpufreq policy
+
+
+def _read_proc(path, size=4096):
+    """pread the head of a /proc file through a kept-open fd.
+
+    procfs regenerates the content on every read at offset 0, so the fd
+    never needs reopening. Inside collect_stats_tlv() each file is read at
+    most once per tick and later readers (e.g. RAM and swap, both from
+    /proc/meminfo) share the buffer. Raises OSError if the file is
+    unavailable.
+    """
+    snapshot = _proc_snapshot
+    if snapshot is not None:
+        buf = snapshot.get(path)
+        if buf is None:
+            buf = snapshot[path] = _pread_proc(path, size)
+        return buf
+    return _pread_proc(path, size)
+
+
+def _pread_proc(path, size):
+    fd = _proc_fds.get(path)
+    if fd is None:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            # Missing here (non-Linux, restricted container); remember that
+            # so later ticks go straight to the psutil fallback
+            _proc_fds[path] = -1
+            raise
+        _proc_fds[path] = fd
+        atexit.register(os.close, fd)
+    elif fd < 0:
+        raise FileNotFoundError(path)
+    return os.pread(fd, size, 0)
+
+
+def _meminfo_kb(buf, key):
+    """Return the kB value of a /proc/meminfo key (e.g. b"MemTotal:")."""
+    start = buf.index(key) + len(key)
+    return int(buf[start:buf.index(b"kB", start)])
+
+
+def fast_cpu_percent():
+    """CPU busy percent since the previous call, from the /proc/stat cpu line.
+
+    Returns 0 on the first call (no baseline yet), like psutil.
+    """
+    global _prev_cpu_times
+    # Only the aggregate "cpu" line is needed; it is always first
+    fields = _read_proc("/proc/stat", 256).split(b"\n", 1)[0].split()
+    # user nice system idle iowait irq softirq steal
+    times = [int(x) for x in fields[1:9]]
+    total = sum(times)
+    busy = total - times[3] - times[4]
+    prev = _prev_cpu_times
+    _prev_cpu_times = (busy, total)
+    if prev is None or total <= prev[1]:
+        return 0
+    return min(int((busy - prev[0]) * 100 / (total - prev[1])), 100)
+
+
+def fast_mem_percent():
+    """RAM usage percent ((total - available) / total), from /proc/meminfo."""
+    buf = _read_proc("/proc/meminfo", 2048)
+    total = _meminfo_kb(buf, b"MemTotal:")
+    avail = _meminfo_kb(buf, b"MemAvailable:")
+    return min(int((total - avail) * 100 / total), 100)
+
+
+def fast_swap_percent():
+    """Swap usage percent, from /proc/meminfo. 0 if there is no swap."""
+    buf = _read_proc("/proc/meminfo", 2048)
+    total = _meminfo_kb(buf, b"SwapTotal:")
+    if total <= 0:
+        return 0
+    free = _meminfo_kb(buf, b"SwapFree:")
+    return min(int((total - free) * 100 / total), 100)
+
+
+def fast_net_counters():
+    """Per-interface {name: (bytes_sent, bytes_recv)}, from /proc/net/dev."""
+    counters = {}
+    # Two header lines, then "  name: rx_bytes ... (8 rx fields) tx_bytes ..."
+    for line in _read_proc("/proc/net/dev", 65536).splitlines()[2:]:
+        name, _, data = line.partition(b":")
+        fields = data.split()
+        counters[name.strip().decode()] = (int(fields[8]), int(fields[0]))
+    return counters
+
+
+def _proc_line_fields(buf, key):
+    """Fields after key on the /proc table line whose name column is key.
+
+    key includes its terminator (b"eth0:" or b"sda "), and must be preceded
+    by padding or a line start, so "sda " doesn't match inside "nvme0sda ".
+    Returns None if no line matches.
+    """
+    pos = buf.find(key)
+    while pos > 0 and buf[pos - 1] not in b" \n":
+        pos = buf.find(key, pos + 1)
+    if pos < 0:
+        return None
+    start = pos + len(key)
+    end = buf.find(b"\n", start)
+    return buf[start:end if end >= 0 else len(buf)].split()
+
+
+def fast_nic_counters(name):
+    """(bytes_sent, bytes_recv) of one interface from /proc/net/dev, or None
+    if it isn't listed. Only that interface's line is parsed."""
+    fields = _proc_line_fields(_read_proc("/proc/net/dev", 65536),
+                               name.encode() + b":")
+    if fields is None:
+        return None
+    return (int(fields[8]), int(fields[0]))
+
+
+def fast_disk_counters(name):
+    """(read_bytes, write_bytes) of one block device from /proc/diskstats, or
+    None if it isn't listed. Only that device's line is parsed."""
+    # "major minor name reads merged sectors_read ms writes merged
+    # sectors_written ..."; diskstats sectors are always 512 bytes
+    fields = _proc_line_fields(_read_proc("/proc/diskstats", 65536),
+                               name.encode() + b" ")
+    if fields is None:
+        return None
+    return (int(fields[2]) * 512, int(fields[6]) * 512)
+
+
+def fast_uptime_seconds():
+    """Seconds since boot, from /proc/uptime."""
+    return float(_read_proc("/proc/uptime", 64).split()[0])
+
+
+def _open_cpufreq_fds():
+    """Open scaling_cur_freq of every cpufreq policy (or, on kernels without
+    policies, every CPU), the same set psutil.cpu_freq() averages over."""
+    base = "/sys/devices/system/cpu"
+    try:
+        paths = [os.path.join(base, "cpufreq", e, "scaling_cur_freq")
+                 for e in os.listdir(os.path.join(base, "cpufreq"))
+                 if e.startswith("policy") and e[6:].isdigit()]
+    except OSError:
+        paths = []
+    if not paths:
+        try:
+            paths = [os.path.join(base, e, "cpufreq", "scaling_cur_freq")
+                     for e in os.listdir(base)
+                     if e.startswith("cpu") and e[3:].isdigit()]
+        except OSError:
+            paths = []
+    fds = []
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        atexit.register(os.close, fd)
+        fds.append(fd)
+    return tuple(fds)
+
+
+def fast_cpu_freq_mhz():
+    """Mean current CPU frequency in MHz from cpufreq sysfs, one pread per
+    policy. Raises OSError if the kernel has no cpufreq driver."""
+    global _cpufreq_fds
+    if _cpufreq_fds is None:
+        _cpufreq_fds = _open_cpufreq_fds()
+    fds = _cpufreq_fds
+    if not fds:
+        raise OSError("cpufreq not available")
+    # scaling_cur_freq is in kHz
+    return int(sum(int(os.pread(fd, 32, 0)) for fd in fds) / len(fds) / 1000)
+
+
+def fast_proc_count():
+    """Number of processes: numeric entries in /proc, counted without
+    building the list of pids psutil.pids() returns."""
+    count = 0
+    with os.scandir("/proc") as entries:
+        for entry in entries:
+            if entry.name[0] in "0123456789":
+                count += 1
+    return count
+
+
 # ---------------------------------------------------------------------------
 # Expanded stat collectors
 # ---------------------------------------------------------------------------
 
+def get_cpu_percent():
+    """Return CPU usage percent since the previous call, or 0."""
+    try:
+        return fast_cpu_percent()
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return min(int(psutil.cpu_percent(interval=None)), 100)
+    except Exception:
+        return 0
+
+
+def get_ram_percent():
+    """Return RAM usage percent, or 0."""
+    try:
+        return fast_mem_percent()
+    except (OSError, ValueError, ZeroDivisionError):
+        pass
+    try:
+        return min(int(psutil.virtual_memory().percent), 100)
+    except Exception:
+        return 0
+
+
 def get_swap_percent():
     """Return swap usage percent, or 0xFF if unavailable."""
+    try:
+        return fast_swap_percent()
+    except (OSError, ValueError):
+        pass
     try:
         swap = psutil.swap_memory()
         return min(int(swap.percent), 100)
@@ -955,8 +1647,33 @@ def get_swap_percent():
         return 0xFF
 
 
+def get_disk_percent(mount="/"):
+    """Return used percent of the filesystem at mount, or 0.
+
+    Same figure as psutil.disk_usage(mount).percent (space reserved for
+    root is excluded), from one statvfs() without the namedtuple.
+    """
+    try:
+        st = os.statvfs(mount)
+        used = st.f_blocks - st.f_bfree
+        total_user = used + st.f_bavail
+        if total_user <= 0:
+            return 0
+        return min(int(round(used * 100 / total_user, 1)), 100)
+    except (OSError, AttributeError):
+        pass
+    try:
+        return min(int(psutil.disk_usage(mount).percent), 100)
+    except Exception:
+        return 0
+
+
 def get_cpu_freq_mhz():
     """Return current CPU frequency in MHz, or 0."""
+    try:
+        return min(fast_cpu_freq_mhz(), 0xFFFF)
+    except (OSError, ValueError):
+        pass
     try:
         freq = psutil.cpu_freq()
         if freq:
@@ -969,18 +1686,30 @@ def get_cpu_freq_mhz():
 def get_uptime_hours():
     """Return system uptime in hours."""
     try:
-        boot = psutil.boot_time()
-        return min(int((time.time() - boot) / 3600), 0xFFFF)
+        return min(int(fast_uptime_seconds() / 3600), 0xFFFF)
+    except (OSError, ValueError, IndexError):
+        pass
+    global _boot_time
+    try:
+        # Boot time is fixed; psutil re-reads it on every call
+        if _boot_time is None:
+            _boot_time = psutil.boot_time()
+        return min(int((time.time() - _boot_time) / 3600), 0xFFFF)
     except Exception:
         return 0
 
 
 def get_battery_percent():
     """Return battery percentage, or 0xFF if no battery."""
+    global _HAS_SENSORS_BATTERY
+    if not _HAS_SENSORS_BATTERY:
+        return 0xFF
     try:
         bat = psutil.sensors_battery()
         if bat is not None:
             return min(int(bat.percent), 100)
+        logging.debug("No battery found, not polling for one again")
+        _HAS_SENSORS_BATTERY = False
     except Exception:
         pass
     return 0xFF
@@ -988,19 +1717,37 @@ def get_battery_percent():
 
 def get_fan_rpm():
     """Return first fan RPM, or 0."""
+    global _HAS_SENSORS_FANS
+    rpm = _fan_input.read()
+    if rpm is not None:
+        return min(rpm, 0xFFFF)
+    if not _HAS_SENSORS_FANS:
+        return 0
     try:
         fans = psutil.sensors_fans()
         if fans:
             for fan_list in fans.values():
                 if fan_list:
                     return min(int(fan_list[0].current), 0xFFFF)
+        else:
+            logging.debug("No fan sensors found, not polling for them again")
+            _HAS_SENSORS_FANS = False
     except Exception:
         pass
     return 0
 
 
 def get_load_avg_x100():
-    """Return 1-min load average x 100 as uint16."""
+    """Return 1-min load average x 100 as uint16.
+
+    Reads /proc/loadavg through a kept-open fd; falls back to
+    os.getloadavg() where /proc is unavailable.
+    """
+    try:
+        buf = _read_proc("/proc/loadavg", 64)
+        return min(int(float(buf[:buf.index(b" ")]) * 100), 0xFFFF)
+    except (OSError, ValueError):
+        pass
     try:
         load1, _, _ = os.getloadavg()
         return min(int(load1 * 100), 0xFFFF)
@@ -1010,6 +1757,10 @@ def get_load_avg_x100():
 
 def get_proc_count():
     """Return number of running processes."""
+    try:
+        return min(fast_proc_count(), 0xFFFF)
+    except OSError:
+        pass
     try:
         return min(len(psutil.pids()), 0xFFFF)
     except Exception:
@@ -1037,41 +1788,205 @@ def get_proc_system_count():
         return 0
 
 
-def get_disk_io(prev_disk_io, dt, disk_device=None):
-    """Return (read_kbs, write_kbs, current_counters).
-
-    If disk_device is set (e.g. "nvme0n1"), report I/O for that device only.
-    Otherwise report aggregate across all disks.
+def get_net_counters(net_interface=None):
+    """Return (bytes_sent, bytes_recv) for net_interface, or summed over all
+    interfaces when it is None. Returns None if net_interface doesn't exist.
+    """
+    try:
+        if net_interface:
+            return fast_nic_counters(net_interface)
+        per_nic = fast_net_counters()
+    except (OSError, ValueError, IndexError):
+        per_nic = {name: (c.bytes_sent, c.bytes_recv)
+                   for name, c in psutil.net_io_counters(pernic=True).items()}
+    if net_interface:
+        return per_nic.get(net_interface)
+    sent = recv = 0
+    for nic_sent, nic_recv in per_nic.values():
+        sent += nic_sent
+        recv += nic_recv
+    return (sent, recv)
+
+
+def get_disk_counters(prev_disk_io, disk_device=None):
+    """Return the current (read_bytes, write_bytes) disk I/O counters, or
+    prev_disk_io on failure.
+
+    If disk_device is set (e.g. "nvme0n1"), read that device only, straight
+    from its /proc/diskstats line. Otherwise read the aggregate across all
+    disks.
     """
     try:
         if disk_device:
-            per_disk = psutil.disk_io_counters(perdisk=True)
-            curr = per_disk.get(disk_device)
-            if curr is None:
-                logging.warning("Disk device '%s' not found, available: %s",
-                                disk_device, list(per_disk.keys()))
-                return (0, 0, prev_disk_io)
-        else:
-            curr = psutil.disk_io_counters()
-        if prev_disk_io is None:
-            return (0, 0, curr)
-        read_kbs = int((curr.read_bytes - prev_disk_io.read_bytes) / dt / 1024)
-        write_kbs = int((curr.write_bytes - prev_disk_io.write_bytes) / dt / 1024)
-        return (max(0, min(read_kbs, 0xFFFF)), max(0, min(write_kbs, 0xFFFF)), curr)
+            try:
+                curr = fast_disk_counters(disk_device)
+                if curr is not None:
+                    return curr
+                per_disk = None
+            except (OSError, ValueError, IndexError):
+                per_disk = psutil.disk_io_counters(perdisk=True)
+                curr = per_disk.get(disk_device)
+                if curr is not None:
+                    return (curr.read_bytes, curr.write_bytes)
+            logging.warning("Disk device '%s' not found, available: %s", disk_device,
+                            list(per_disk or psutil.disk_io_counters(perdisk=True)))
+            return prev_disk_io
+        curr = psutil.disk_io_counters()
+        if curr is None:
+            return prev_disk_io
+        return (curr.read_bytes, curr.write_bytes)
     except Exception:
-        return (0, 0, prev_disk_io)
+        return prev_disk_io
+
+
+def _compute_rates(sent_delta, recv_delta, read_delta, write_delta, dt_ns):
+    """Convert byte-counter deltas over dt_ns nanoseconds to KB/s.
+
+    Returns (net_up, net_down, disk_read, disk_write), each clamped to
+    0..0xFFFF.
+    """
+    if dt_ns <= 0:
+        dt_ns = 1000000000
+    up = (sent_delta >> 10) * 1000000000 // dt_ns
+    down = (recv_delta >> 10) * 1000000000 // dt_ns
+    read = (read_delta >> 10) * 1000000000 // dt_ns
+    write = (write_delta >> 10) * 1000000000 // dt_ns
+    up = 0 if up < 0 else (0xFFFF if up > 0xFFFF else up)
+    down = 0 if down < 0 else (0xFFFF if down > 0xFFFF else down)
+    read = 0 if read < 0 else (0xFFFF if read > 0xFFFF else read)
+    write = 0 if write < 0 else (0xFFFF if write > 0xFFFF else write)
+    return (up, down, read, write)
 
 
 # ---------------------------------------------------------------------------
 # Stats collection (TLV + legacy)
 # ---------------------------------------------------------------------------
 
+# Stat types whose value comes from a single argument-free call. The rest
+# (GPU, disk, rates, process counts) share work or state and are resolved
+# into the other _StatPlan fields.
+_SIMPLE_COLLECTORS = {
+    STAT_TYPES['cpu_percent']:  get_cpu_percent,
+    STAT_TYPES['ram_percent']:  get_ram_percent,
+    STAT_TYPES['cpu_temp']:     get_cpu_temp,
+    STAT_TYPES['cpu_freq']:     get_cpu_freq_mhz,
+    STAT_TYPES['swap_percent']: get_swap_percent,
+    STAT_TYPES['uptime_hours']: get_uptime_hours,
+    STAT_TYPES['battery_pct']:  get_battery_percent,
+    STAT_TYPES['fan_rpm']:      get_fan_rpm,
+    STAT_TYPES['load_avg']:     get_load_avg_x100,
+}
+
+# Index into GPUCollector.collect_all()'s result tuple
+_GPU_FIELDS = {
+    STAT_TYPES['gpu_percent']: 0,
+    STAT_TYPES['gpu_temp']:    1,
+    STAT_TYPES['gpu_mem_pct']: 2,
+    STAT_TYPES['gpu_power_w']: 3,
+    STAT_TYPES['gpu_freq']:    4,
+}
+
+# Index into _compute_rates()'s (net_up, net_down, disk_read, disk_write)
+_RATE_FIELDS = {
+    STAT_TYPES['net_up']:         0,
+    STAT_TYPES['net_down']:       1,
+    STAT_TYPES['disk_read_kbs']:  2,
+    STAT_TYPES['disk_write_kbs']: 3,
+}
+
+# proc_state key and collector for each throttled process stat
+_PROC_FIELDS = {
+    STAT_TYPES['proc_count']:  ('count', get_proc_count),
+    STAT_TYPES['proc_user']:   ('user', get_proc_user_count),
+    STAT_TYPES['proc_system']: ('system', get_proc_system_count),
+}
+
+
+# Per-collector run time (EWMA, ns), kept only while debug logging is on
+_collector_timings = {}
+
+
+def _record_timing(name, start_ns):
+    elapsed = time.perf_counter_ns() - start_ns
+    prev = _collector_timings.get(name)
+    _collector_timings[name] = elapsed if prev is None else prev * 0.9 + elapsed * 0.1
+
+
+def _timed(name, collect):
+    """Wrap an argument-free collector to record its run time."""
+    def timed():
+        start = time.perf_counter_ns()
+        value = collect()
+        _record_timing(name, start)
+        return value
+    return timed
+
+
+class _StatPlan:
+    """Enabled stats resolved once per config load, so a stats tick runs
+    straight through precomputed tables instead of testing every stat type
+    for membership."""
+
+    __slots__ = ("simple", "gpu", "gpu_fields", "disk_percent", "rates", "need_net",
+                 "need_disk_io", "proc", "profile")
+
+    def __init__(self, enabled_types):
+        enabled = set(enabled_types)
+        # Timing every collector is only worth it when someone reads the log
+        self.profile = logging.getLogger().isEnabledFor(logging.DEBUG)
+        if self.profile:
+            self.simple = tuple((t, _timed(STAT_ID_TO_NAME[t], _SIMPLE_COLLECTORS[t]))
+                                for t in enabled_types if t in _SIMPLE_COLLECTORS)
+        else:
+            self.simple = tuple((t, _SIMPLE_COLLECTORS[t]) for t in enabled_types
+                                if t in _SIMPLE_COLLECTORS)
+        self.gpu = tuple((t, i) for t, i in _GPU_FIELDS.items() if t in enabled)
+        self.gpu_fields = frozenset(i for _, i in self.gpu)
+        self.disk_percent = STAT_TYPES['disk_percent'] in enabled
+        self.rates = tuple((t, i) for t, i in _RATE_FIELDS.items() if t in enabled)
+        self.need_net = any(i < 2 for _, i in self.rates)
+        self.need_disk_io = any(i >= 2 for _, i in self.rates)
+        self.proc = tuple((t,) + f for t, f in _PROC_FIELDS.items() if t in enabled)
+
+
+def build_stat_collectors(enabled_types):
+    """Return the _StatPlan for enabled_types."""
+    return _StatPlan(enabled_types)
+
+
+def _stats_steady(prev, packed, offset=0):
+    """True if every stat value in packed is within STATS_STEADY_DELTA of prev.
+
+    Both are TLV packets from encode_stats_tlv() for the same stat plan,
+    whose count byte is at offset (after the header). Values are decoded
+    per entry, so a 2-byte value is compared whole; a change in the
+    entries themselves counts as movement.
+    """
+    if prev is None or len(prev) != len(packed) or prev[:offset + 1] != packed[:offset + 1]:
+        return False
+    i = offset + 1
+    end = len(packed)
+    while i < end:
+        size = packed[i + 1]
+        if prev[i] != packed[i] or prev[i + 1] != size:
+            return False
+        i += 2
+        a = int.from_bytes(prev[i:i + size], "little")
+        b = int.from_bytes(packed[i:i + size], "little")
+        if abs(a - b) > STATS_STEADY_DELTA:
+            return False
+        i += size
+    return True
+
+
 def collect_stats_tlv(gpu_collector, enabled_types, prev_net, prev_time, prev_disk_io,
                       net_interface=None, disk_device=None, disk_mount="/",
-                      proc_update_interval=30, proc_state=None):
+                      proc_update_interval=30, proc_state=None, collectors=None,
+                      header=b""):
     """Collect system metrics based on enabled types and return TLV-encoded bytes.
 
-    Returns (tlv_bytes, current_net_counters, current_time, current_disk_io).
+    Returns (tlv_bytes, current_net_counters, current_time, current_disk_io);
+    times are time.monotonic_ns() values, prev_time included.
     Only collects stats that are in enabled_types (saves CPU on unused psutil calls).
 
     net_interface: NIC name for per-interface network stats, or None for aggregate.
@@ -1079,153 +1994,83 @@ def collect_stats_tlv(gpu_collector, enabled_types, prev_net, prev_time, prev_di
     disk_mount:    mount path for disk usage %, defaults to "/".
     proc_update_interval: seconds between proc stat collection (default 30).
     proc_state: dict with 'last_time', 'count', 'user', 'system' for throttling.
+    collectors: build_stat_collectors(enabled_types), precomputed by the caller
+                so the plan isn't rebuilt every tick.
+    header: bytes to emit before the TLV payload (see encode_stats_tlv).
     """
-    now = time.time()
-    dt = now - prev_time
-    if dt <= 0:
-        dt = 1.0
+    # Monotonic, so wall-clock steps (NTP, suspend) can't skew the rates
+    now = time.monotonic_ns()
+    dt_ns = now - prev_time
+    plan = collectors
+    if plan is None:
+        plan = build_stat_collectors(enabled_types)
+
+    global _proc_snapshot
+    _proc_snapshot = {}
+    try:
+        return _collect_stats_tlv(plan, gpu_collector, prev_net, prev_disk_io,
+                                  net_interface, disk_device, disk_mount,
+                                  proc_update_interval, proc_state, now, dt_ns, header)
+    finally:
+        _proc_snapshot = None
 
-    enabled_set = set(enabled_types)
-    stats_list = []
+
+def _collect_stats_tlv(plan, gpu_collector, prev_net, prev_disk_io, net_interface,
+                       disk_device, disk_mount, proc_update_interval, proc_state,
+                       now, dt_ns, header):
+    # Argument-free collectors straight from the prebuilt table
+    stats_list = [(stat_type, collect()) for stat_type, collect in plan.simple]
     curr_net = prev_net
     curr_disk_io = prev_disk_io
 
-    # CPU percent
-    if STAT_TYPES['cpu_percent'] in enabled_set:
-        try:
-            val = min(int(psutil.cpu_percent(interval=None)), 100)
-        except Exception:
-            val = 0
-        stats_list.append((STAT_TYPES['cpu_percent'], val))
-
-    # RAM percent
-    if STAT_TYPES['ram_percent'] in enabled_set:
-        try:
-            val = min(int(psutil.virtual_memory().percent), 100)
-        except Exception:
-            val = 0
-        stats_list.append((STAT_TYPES['ram_percent'], val))
-
-    # GPU percent & temp
-    need_gpu = (STAT_TYPES['gpu_percent'] in enabled_set or
-                STAT_TYPES['gpu_temp'] in enabled_set or
-                STAT_TYPES['gpu_mem_pct'] in enabled_set or
-                STAT_TYPES['gpu_power_w'] in enabled_set or
-                STAT_TYPES['gpu_freq'] in enabled_set)
-    if need_gpu:
-        gpu_pct, gpu_temp = gpu_collector.collect()
-        if STAT_TYPES['gpu_percent'] in enabled_set:
-            stats_list.append((STAT_TYPES['gpu_percent'], gpu_pct))
-        if STAT_TYPES['gpu_temp'] in enabled_set:
-            stats_list.append((STAT_TYPES['gpu_temp'], gpu_temp))
-        # Extended GPU stats (NVIDIA only — pynvml or nvidia-smi)
-        if gpu_collector.gpu_type in ("nvidia", "nvidia-smi"):
-            gpu_mem, gpu_power, gpu_freq = gpu_collector.collect_extended()
-            if STAT_TYPES['gpu_mem_pct'] in enabled_set:
-                stats_list.append((STAT_TYPES['gpu_mem_pct'], gpu_mem))
-            if STAT_TYPES['gpu_power_w'] in enabled_set:
-                stats_list.append((STAT_TYPES['gpu_power_w'], gpu_power))
-            if STAT_TYPES['gpu_freq'] in enabled_set:
-                stats_list.append((STAT_TYPES['gpu_freq'], gpu_freq))
-        else:
-            if STAT_TYPES['gpu_mem_pct'] in enabled_set:
-                stats_list.append((STAT_TYPES['gpu_mem_pct'], 0xFF))
-            if STAT_TYPES['gpu_power_w'] in enabled_set:
-                stats_list.append((STAT_TYPES['gpu_power_w'], 0))
-            if STAT_TYPES['gpu_freq'] in enabled_set:
-                stats_list.append((STAT_TYPES['gpu_freq'], 0))
-
-    # CPU temp
-    if STAT_TYPES['cpu_temp'] in enabled_set:
-        stats_list.append((STAT_TYPES['cpu_temp'], get_cpu_temp()))
+    # GPU: one collect_all() feeds every enabled GPU stat
+    if plan.gpu:
+        start = time.perf_counter_ns()
+        gpu_values = gpu_collector.collect_all(plan.gpu_fields)
+        if plan.profile:
+            _record_timing("gpu", start)
+        stats_list.extend((stat_type, gpu_values[i]) for stat_type, i in plan.gpu)
 
     # Disk percent (configurable mount point)
-    if STAT_TYPES['disk_percent'] in enabled_set:
-        try:
-            val = min(int(psutil.disk_usage(disk_mount).percent), 100)
-        except Exception:
-            val = 0
-        stats_list.append((STAT_TYPES['disk_percent'], val))
-
-    # Network (per-interface or aggregate)
-    if STAT_TYPES['net_up'] in enabled_set or STAT_TYPES['net_down'] in enabled_set:
-        try:
-            if net_interface:
-                per_nic = psutil.net_io_counters(pernic=True)
-                curr_net = per_nic.get(net_interface)
+    if plan.disk_percent:
+        stats_list.append((STAT_TYPES['disk_percent'], get_disk_percent(disk_mount)))
+
+    # Network (per-interface or aggregate) and disk I/O counters. Rates for
+    # both are computed together in one _compute_rates() call.
+    if plan.rates:
+        sent_delta = recv_delta = read_delta = write_delta = 0
+        if plan.need_net:
+            try:
+                curr_net = get_net_counters(net_interface)
                 if curr_net is None:
-                    logging.warning("NIC '%s' not found, available: %s",
-                                    net_interface, list(per_nic.keys()))
+                    logging.warning("NIC '%s' not found", net_interface)
                     curr_net = prev_net
-            else:
-                curr_net = psutil.net_io_counters()
-            net_up = int((curr_net.bytes_sent - prev_net.bytes_sent) / dt / 1024)
-            net_down = int((curr_net.bytes_recv - prev_net.bytes_recv) / dt / 1024)
-            net_up = max(0, min(net_up, 0xFFFF))
-            net_down = max(0, min(net_down, 0xFFFF))
-        except Exception:
-            curr_net = prev_net
-            net_up = 0
-            net_down = 0
-        if STAT_TYPES['net_up'] in enabled_set:
-            stats_list.append((STAT_TYPES['net_up'], net_up))
-        if STAT_TYPES['net_down'] in enabled_set:
-            stats_list.append((STAT_TYPES['net_down'], net_down))
-
-    # CPU freq
-    if STAT_TYPES['cpu_freq'] in enabled_set:
-        stats_list.append((STAT_TYPES['cpu_freq'], get_cpu_freq_mhz()))
-
-    # Swap
-    if STAT_TYPES['swap_percent'] in enabled_set:
-        stats_list.append((STAT_TYPES['swap_percent'], get_swap_percent()))
-
-    # Uptime
-    if STAT_TYPES['uptime_hours'] in enabled_set:
-        stats_list.append((STAT_TYPES['uptime_hours'], get_uptime_hours()))
-
-    # Battery
-    if STAT_TYPES['battery_pct'] in enabled_set:
-        stats_list.append((STAT_TYPES['battery_pct'], get_battery_percent()))
-
-    # Fan RPM
-    if STAT_TYPES['fan_rpm'] in enabled_set:
-        stats_list.append((STAT_TYPES['fan_rpm'], get_fan_rpm()))
-
-    # Load average
-    if STAT_TYPES['load_avg'] in enabled_set:
-        stats_list.append((STAT_TYPES['load_avg'], get_load_avg_x100()))
+                sent_delta = curr_net[0] - prev_net[0]
+                recv_delta = curr_net[1] - prev_net[1]
+            except Exception:
+                curr_net = prev_net
+                sent_delta = recv_delta = 0
+        if plan.need_disk_io:
+            curr_disk_io = get_disk_counters(prev_disk_io, disk_device)
+            if prev_disk_io is not None and curr_disk_io is not None:
+                read_delta = curr_disk_io[0] - prev_disk_io[0]
+                write_delta = curr_disk_io[1] - prev_disk_io[1]
+        rates = _compute_rates(sent_delta, recv_delta, read_delta, write_delta,
+                               dt_ns)
+        stats_list.extend((stat_type, rates[i]) for stat_type, i in plan.rates)
 
     # Process stats (throttled by proc_update_interval)
-    proc_types = {STAT_TYPES['proc_count'], STAT_TYPES['proc_user'], STAT_TYPES['proc_system']}
-    need_proc = bool(proc_types & enabled_set)
-    if need_proc:
+    if plan.proc:
         if proc_state is None:
-            proc_state = {'last_time': 0, 'count': 0, 'user': 0, 'system': 0}
-        if now - proc_state['last_time'] >= proc_update_interval:
+            proc_state = {'last_time': None, 'count': 0, 'user': 0, 'system': 0}
+        last = proc_state['last_time']
+        if last is None or now - last >= proc_update_interval * 1000000000:
             proc_state['last_time'] = now
-            if STAT_TYPES['proc_count'] in enabled_set:
-                proc_state['count'] = get_proc_count()
-            if STAT_TYPES['proc_user'] in enabled_set:
-                proc_state['user'] = get_proc_user_count()
-            if STAT_TYPES['proc_system'] in enabled_set:
-                proc_state['system'] = get_proc_system_count()
-        if STAT_TYPES['proc_count'] in enabled_set:
-            stats_list.append((STAT_TYPES['proc_count'], proc_state['count']))
-        if STAT_TYPES['proc_user'] in enabled_set:
-            stats_list.append((STAT_TYPES['proc_user'], proc_state['user']))
-        if STAT_TYPES['proc_system'] in enabled_set:
-            stats_list.append((STAT_TYPES['proc_system'], proc_state['system']))
-
-    # Disk I/O (per-device or aggregate)
-    if STAT_TYPES['disk_read_kbs'] in enabled_set or STAT_TYPES['disk_write_kbs'] in enabled_set:
-        read_kbs, write_kbs, curr_disk_io = get_disk_io(prev_disk_io, dt, disk_device)
-        if STAT_TYPES['disk_read_kbs'] in enabled_set:
-            stats_list.append((STAT_TYPES['disk_read_kbs'], read_kbs))
-        if STAT_TYPES['disk_write_kbs'] in enabled_set:
-            stats_list.append((STAT_TYPES['disk_write_kbs'], write_kbs))
-
-    tlv_bytes = encode_stats_tlv(stats_list)
+            for _, key, collect in plan.proc:
+                proc_state[key] = collect()
+        stats_list.extend((stat_type, proc_state[key]) for stat_type, key, _ in plan.proc)
+
+    tlv_bytes = encode_stats_tlv(stats_list, header)
     return (tlv_bytes, curr_net, now, curr_disk_io)
 
 
@@ -1233,6 +2078,31 @@ def collect_stats_tlv(gpu_collector, enabled_types, prev_net, prev_time, prev_di
 # Main
 # ---------------------------------------------------------------------------
 
+def _run_action(fn, *args):
+    """Action pool entry point: log failures, which a Future would swallow."""
+    try:
+        fn(*args)
+    except Exception:
+        logging.exception("Action %s failed", fn.__name__)
+
+
+# Queued in place of a stats packet: the writer sends whatever is in
+# CompanionService._stats_slot at that point, i.e. the latest stats
+_STATS_SLOT = object()
+# Queued by stop(): the writer thread exits when it gets here
+_HID_WRITER_STOP = object()
+
+
+class _QueuedHidWriter:
+    """Stand-in for the HID device handed to the send_* helpers: write()
+    queues the packet for CompanionService's writer thread."""
+
+    __slots__ = ("write",)
+
+    def __init__(self, tx_queue):
+        self.write = tx_queue.put
+
+
 class CompanionService:
     """Background service: bridge communication, stats streaming, action dispatch.
 
@@ -1245,7 +2115,22 @@ class CompanionService:
     def __init__(self, config_manager=None):
         self._running = False
         self._device = None
+        # All HID writes go through _hid_tx_q to the single writer thread, so
+        # producers never block on the device. _hid_lock is held only by that
+        # thread around each write, and _hid_read_lock by the vendor reader
+        # around its 100 ms poll; closing the device takes both.
+        self._hid_tx_q = queue.SimpleQueue()
+        self._hid_tx = _QueuedHidWriter(self._hid_tx_q)
+        # Latest stats packet not yet written. A newer tick replaces it
+        # rather than queueing behind it, so a stalled device never has
+        # more than one (the freshest) stats report waiting.
+        self._stats_slot = None
+        self._stats_slot_lock = threading.Lock()
+        self._hid_write_failed = threading.Event()
+        self._hid_writer_thread = None
+        self._action_pool = None
         self._hid_lock = threading.Lock()
+        self._hid_read_lock = threading.Lock()
         self._config_mgr = config_manager or get_config_manager()
         self._config_path = str(DEFAULT_CONFIG_PATH)
         self._config_watcher = None
@@ -1253,11 +2138,13 @@ class CompanionService:
         self._stats_thread = None
         self._vendor_thread = None
         self._enabled_stat_types = []
+        self._stat_collectors = None
+        self._input_report_buffer = 128
         self._net_interface = None
         self._disk_device = None
         self._disk_mount = "/"
         self._proc_update_interval = 30
-        self._proc_state = {'last_time': 0, 'count': 0, 'user': 0, 'system': 0}
+        self._proc_state = {'last_time': None, 'count': 0, 'user': 0, 'system': 0}
 
         # Status callbacks
         self.on_bridge_connected = None
@@ -1267,7 +2154,9 @@ class CompanionService:
 
         # Readable state
         self._bridge_connected = False
+        self._status_text = "Bridge: Disconnected"
         self._stats_count = 0
+        self._stats_interval = UPDATE_INTERVAL  # Current adaptive sampling period
 
     @property
     def is_bridge_connected(self) -> bool:
@@ -1279,7 +2168,7 @@ class CompanionService:
         Call reclaim_bridge() when done.  The stats/vendor loops keep running
         but will skip I/O until the device is reclaimed.
         """
-        with self._hid_lock:
+        with self._hid_read_lock, self._hid_lock:
             if self._device is not None:
                 try:
                     self._device.close()
@@ -1290,55 +2179,71 @@ class CompanionService:
 
     def reclaim_bridge(self):
         """Re-open the bridge HID device after release_bridge()."""
-        path = find_bridge()
-        if path is None:
-            logging.warning("Cannot reclaim bridge: device not found")
-            return
         try:
-            if hasattr(hid, 'Device'):
-                self._device = hid.Device(path=path)
-            else:
-                self._device = hid.device()
-                self._device.open_path(path)
-            logging.info("Bridge reclaimed after deploy")
+            device = open_bridge()
         except Exception as exc:
             logging.error("Failed to reclaim bridge: %s", exc)
             self._device = None
+            return
+        if device is None:
+            logging.warning("Cannot reclaim bridge: device not found")
+            return
+        _set_input_report_buffer(device, self._input_report_buffer)
+        self._device = device
+        logging.info("Bridge reclaimed after deploy")
 
     @property
     def status_text(self) -> str:
+        return self._status_text
+
+    def profile_snapshot(self):
+        """Return {collector name: average run time in ns}.
+
+        Collectors are only timed while debug logging is enabled; otherwise
+        this is empty.
+        """
+        return dict(_collector_timings)
+
+    def _update_status_text(self):
+        # Polled by the tray on every stats tick; only rebuilt when the
+        # connection state or the stat config changes
         if self._bridge_connected:
-            return f"Bridge: Connected, Stats: {len(self._enabled_stat_types)} types @ 1Hz"
-        return "Bridge: Disconnected"
+            self._status_text = (f"Bridge: Connected, Stats: "
+                                 f"{len(self._enabled_stat_types)} types @ "
+                                 f"{1.0 / self._stats_interval:g}Hz")
+        else:
+            self._status_text = "Bridge: Disconnected"
 
     def start(self):
         """Start all background threads (non-blocking)."""
         if self._running:
             return
 
+        global _stats_wake_fd
         self._running = True
         DEFAULT_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        if _stats_wake_fd is None:
+            # Kept for the life of the process: stop() doesn't join the
+            # stats thread, so it may still be waiting on the fd
+            _stats_wake_fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
 
         # Load config
         self._config_mgr.load_json_file(self._config_path)
         self._load_device_config()
         logging.info("Enabled stat types: %s",
-                     [STAT_ID_TO_NAME.get(t, f"0x{t:02X}") for t in self._enabled_stat_types])
+                     [STAT_ID_TO_NAME[t] for t in self._enabled_stat_types])
 
         # Initialize GPU collector
         self._gpu = GPUCollector()
-        psutil.cpu_percent()  # Prime — first call always returns 0
+        get_cpu_percent()  # Prime — first call always returns 0
 
         # Start config file watcher
         self._config_watcher = _start_config_watcher(self._config_path, self._config_mgr)
 
-        # D-Bus shutdown listener
-        threading.Thread(target=_run_dbus_listener, daemon=True).start()
-
         # Session lock listener (for follow_lock feature)
         self._follow_lock = load_follow_lock_config(self._config_path)
+        self._input_report_buffer = load_input_report_buffer_config(self._config_path)
         if self._follow_lock:
-            threading.Thread(target=_run_session_lock_listener, daemon=True).start()
             logging.info("Session lock following enabled")
         else:
             logging.info("Session lock following disabled")
@@ -1351,22 +2256,50 @@ class CompanionService:
         else:
             logging.info("Notification forwarding disabled")
 
+        # Shutdown, session lock and notification listeners share one
+        # D-Bus thread and event loop
+        threading.Thread(
+            target=_run_dbus_supervisor,
+            args=(self._follow_lock, notif_filter,
+                  self._forward_notification if notif_enabled else None),
+            daemon=True
+        ).start()
+
+        # Button actions and DDC commands run on a small reused pool
+        self._action_pool = ThreadPoolExecutor(
+            max_workers=ACTION_WORKERS, thread_name_prefix="action")
+
+        # Single HID writer, fed by _hid_tx_q
+        self._hid_writer_thread = threading.Thread(target=self._hid_writer_loop, daemon=True)
+        self._hid_writer_thread.start()
+
         # Main stats + bridge thread
-        self._stats_thread = threading.Thread(
-            target=self._stats_loop, args=(notif_enabled, notif_filter), daemon=True
-        )
+        self._stats_thread = threading.Thread(target=self._stats_loop, daemon=True)
         self._stats_thread.start()
 
     def stop(self):
         """Clean shutdown of all threads."""
+        self._flush_hid_tx()
         self._running = False
+        _wake_stats_loop()
+        writer = self._hid_writer_thread
+        if writer is not None:
+            self._hid_tx_q.put(_HID_WRITER_STOP)
+            writer.join(timeout=2.0)
+            self._hid_writer_thread = None
+        if self._action_pool is not None:
+            self._action_pool.shutdown(wait=False, cancel_futures=True)
+            self._action_pool = None
         if self._device is not None:
             try:
                 self._device.close()
             except Exception:
                 pass
             self._device = None
+        if self._gpu is not None:
+            self._gpu.close()
         self._bridge_connected = False
+        self._update_status_text()
         logging.info("CompanionService stopped.")
 
     def _load_device_config(self):
@@ -1374,6 +2307,8 @@ class CompanionService:
         (self._enabled_stat_types, self._net_interface,
          self._disk_device, self._disk_mount,
          self._proc_update_interval) = load_stats_config(self._config_path)
+        self._stat_collectors = build_stat_collectors(self._enabled_stat_types)
+        self._update_status_text()
         if self._net_interface:
             logging.info("Network interface: %s", self._net_interface)
         if self._disk_device:
@@ -1390,6 +2325,8 @@ class CompanionService:
     def _set_bridge_connected(self, connected):
         prev = self._bridge_connected
         self._bridge_connected = connected
+        if connected != prev:
+            self._update_status_text()
         if connected and not prev:
             if self.on_bridge_connected:
                 self.on_bridge_connected()
@@ -1397,37 +2334,81 @@ class CompanionService:
             if self.on_bridge_disconnected:
                 self.on_bridge_disconnected()
 
+    def _set_stats_interval(self, interval):
+        if interval != self._stats_interval:
+            self._stats_interval = interval
+            self._update_status_text()
+            logging.debug("Sampling stats every %.1f s", interval)
+
     def _connect_bridge(self):
-        """Discover and connect to bridge. Blocks until connected or stopped."""
+        """Discover and connect to bridge. Blocks until connected or stopped.
+
+        While no bridge is present, waits for a hidraw hotplug event when
+        udev is available, otherwise re-scans every RETRY_INTERVAL seconds.
+        A bridge that is present but fails to open (e.g. EACCES before the
+        udev rule applies) is always retried every RETRY_INTERVAL, since
+        fixing that produces no "add" event.
+        """
+        monitor = _open_hidraw_monitor()
         while self._running:
-            path = find_bridge()
-            if path is not None:
+            open_failed = False
+            try:
+                self._device = open_bridge()
+            except Exception as exc:
+                logging.error("Failed to open bridge: %s", exc)
+                self._device = None
+                open_failed = True
+            if self._device is not None:
                 try:
-                    if hasattr(hid, 'Device'):
-                        self._device = hid.Device(path=path)
-                    else:
-                        self._device = hid.device()
-                        self._device.open_path(path)
                     product = getattr(self._device, 'product', '') or ''
                     manufacturer = getattr(self._device, 'manufacturer', '') or ''
                     serial = getattr(self._device, 'serial', '') or ''
                     logging.info("Connected to %s (manufacturer=%s, serial=%s)",
                                  product, manufacturer, serial)
+                    _set_input_report_buffer(self._device, self._input_report_buffer)
                     self._set_bridge_connected(True)
                     return True
                 except Exception as exc:
                     logging.error("Failed to open bridge: %s", exc)
                     self._device = None
-            logging.info("Bridge not found, retrying in %.0fs...", RETRY_INTERVAL)
-            time.sleep(RETRY_INTERVAL)
+                    open_failed = True
+            if open_failed:
+                logging.info("Retrying bridge in %.0fs...", RETRY_INTERVAL)
+                time.sleep(RETRY_INTERVAL)
+            elif monitor is None:
+                logging.info("Bridge not found, retrying in %.0fs...", RETRY_INTERVAL)
+                time.sleep(RETRY_INTERVAL)
+            else:
+                logging.info("Bridge not found, waiting for it to be plugged in...")
+                monitor = self._wait_for_hidraw_add(monitor)
         return False
 
+    def _wait_for_hidraw_add(self, monitor):
+        """Block until a hidraw device is added or changed (udevadm trigger
+        after a rule change), or the service stops.
+
+        Returns the monitor, or None if it failed and the caller should fall
+        back to polling.
+        """
+        try:
+            while self._running:
+                device = monitor.poll(timeout=RETRY_INTERVAL)
+                if device is not None and device.action in ("add", "change"):
+                    return monitor
+        except Exception as exc:
+            logging.debug("udev monitor failed, falling back to polling: %s", exc)
+            return None
+        return monitor
+
     def _vendor_read_loop(self):
         """Background: reads vendor HID input reports from bridge."""
-        while self._running and self._device is not None:
+        while self._running:
             try:
-                with self._hid_lock:
-                    data = self._device.read(63, timeout=100)
+                with self._hid_read_lock:
+                    device = self._device
+                    if device is None:
+                        break
+                    data = device.read(63, timeout=100)
                 if data and len(data) >= 4:
                     # data[0] is the HID report ID (0x06), actual payload starts at data[1]
                     msg_type = data[1]
@@ -1437,33 +2418,95 @@ class CompanionService:
                         logging.info("Button press: page=%d widget=%d", page_idx, widget_idx)
                         if self.on_button_press:
                             self.on_button_press(page_idx, widget_idx)
-                        threading.Thread(
-                            target=execute_action,
-                            args=(self._config_mgr, page_idx, widget_idx),
-                            daemon=True
-                        ).start()
+                        self._submit_action(execute_action, self._config_mgr,
+                                            page_idx, widget_idx)
                     elif msg_type == MSG_DDC_CMD and len(data) >= 8:
                         vcp_code = data[2]
-                        value = struct.unpack_from('<H', bytes(data), 3)[0]
-                        adjustment = struct.unpack_from('<h', bytes(data), 5)[0]
+                        raw = bytes(data)
+                        value = _U16_LE.unpack_from(raw, 3)[0]
+                        adjustment = _I16_LE.unpack_from(raw, 5)[0]
                         display_num = data[7]
                         logging.info("DDC cmd: vcp=0x%02X val=%d adj=%d disp=%d",
                                      vcp_code, value, adjustment, display_num)
-                        threading.Thread(
-                            target=execute_ddc_direct,
-                            args=(vcp_code, value, adjustment, display_num),
-                            daemon=True
-                        ).start()
+                        self._submit_action(execute_ddc_direct, vcp_code, value,
+                                            adjustment, display_num)
             except (IOError, OSError):
                 logging.warning("Vendor HID read error, device may have disconnected")
                 break
             except Exception as exc:
                 logging.debug("Vendor read thread error: %s", exc)
 
-    def _stats_loop(self, notif_enabled, notif_filter):
-        """Main loop: bridge discovery, stats streaming, reconnection."""
-        global running
+    def _submit_action(self, fn, *args):
+        """Run fn(*args) on the action pool without blocking the reader."""
+        pool = self._action_pool
+        if pool is None:
+            return
+        try:
+            pool.submit(_run_action, fn, *args)
+        except RuntimeError:
+            pass  # Pool shut down by stop()
+
+    def _hid_writer_loop(self):
+        """Background: the only thread that writes to the HID device.
+
+        Drains _hid_tx_q in order until the _HID_WRITER_STOP marker queued by
+        stop(), so a restart can't leave a second writer on the same queue.
+        Packets are dropped while no bridge is connected; a failed write flags
+        _hid_write_failed for the stats loop to reconnect, and later packets
+        for that device are dropped.
+        """
+        slot_lock = self._stats_slot_lock
+        get = self._hid_tx_q.get
+        failed_device = None
+        while True:
+            packet = get()
+            if packet is _HID_WRITER_STOP:
+                return
+            if packet is _STATS_SLOT:
+                with slot_lock:
+                    packet, self._stats_slot = self._stats_slot, None
+                if packet is None:
+                    continue
+            elif isinstance(packet, threading.Event):
+                packet.set()  # Flush marker, see _flush_hid_tx()
+                continue
+            with self._hid_lock:
+                device = self._device
+                if device is None or device is failed_device:
+                    continue
+                try:
+                    device.write(packet)
+                except (IOError, OSError) as exc:
+                    logging.warning("HID write failed (device disconnected?): %s", exc)
+                    failed_device = device
+                    self._hid_write_failed.set()
+
+    def _post_stats(self, packet):
+        """Queue a stats packet, superseding one that is still waiting."""
+        with self._stats_slot_lock:
+            waiting = self._stats_slot is not None
+            self._stats_slot = packet
+        if waiting:
+            logging.debug("HID busy, replacing the queued stats report")
+        else:
+            self._hid_tx_q.put(_STATS_SLOT)
+
+    def _flush_hid_tx(self):
+        """Wait until everything queued so far has been written (or dropped)."""
+        writer = self._hid_writer_thread
+        if writer is None or not writer.is_alive():
+            return
+        done = threading.Event()
+        self._hid_tx_q.put(done)
+        done.wait(HID_FLUSH_TIMEOUT)
 
+    def _forward_notification(self, app_name, summary, body):
+        """Notification listener callback: relay to the bridge if connected."""
+        if self._device is not None:
+            send_notification_to_display(self._hid_tx, app_name, summary, body)
+
+    def _stats_loop(self):
+        """Main loop: bridge discovery, stats streaming, reconnection."""
         if not self._connect_bridge():
             return
 
@@ -1471,54 +2514,51 @@ class CompanionService:
         self._vendor_thread = threading.Thread(target=self._vendor_read_loop, daemon=True)
         self._vendor_thread.start()
 
-        # Start notification listener if enabled
-        if notif_enabled and self._device is not None:
-            threading.Thread(
-                target=_run_notification_listener,
-                args=(notif_filter,
-                      lambda app, s, b: send_notification_to_display(
-                          self._device, app, s, b, self._hid_lock)),
-                daemon=True
-            ).start()
-
         # Initialize baselines (per-interface/device if configured)
         try:
-            if self._net_interface:
-                prev_net = psutil.net_io_counters(pernic=True).get(self._net_interface)
-                if prev_net is None:
-                    logging.warning("NIC '%s' not found, falling back to aggregate", self._net_interface)
-                    prev_net = psutil.net_io_counters()
-            else:
-                prev_net = psutil.net_io_counters()
+            prev_net = get_net_counters(self._net_interface)
+            if prev_net is None:
+                logging.warning("NIC '%s' not found, falling back to aggregate", self._net_interface)
+                prev_net = get_net_counters()
         except Exception:
-            prev_net = psutil.net_io_counters()
-        prev_time = time.time()
+            prev_net = (0, 0)
+        prev_time = time.monotonic_ns()
         prev_disk_io = None
-        try:
-            if self._disk_device:
-                per_disk = psutil.disk_io_counters(perdisk=True)
-                prev_disk_io = per_disk.get(self._disk_device)
-                if prev_disk_io is None:
-                    logging.warning("Disk '%s' not found, falling back to aggregate", self._disk_device)
-                    prev_disk_io = psutil.disk_io_counters()
-            else:
-                prev_disk_io = psutil.disk_io_counters()
-        except Exception:
-            pass
+        if self._disk_device:
+            prev_disk_io = get_disk_counters(None, self._disk_device)
+            if prev_disk_io is None:
+                logging.warning("Disk '%s' not found, falling back to aggregate", self._disk_device)
+        if prev_disk_io is None:
+            prev_disk_io = get_disk_counters(None)
 
-        logging.info("Streaming TLV stats at %.1f Hz (%d stat types)",
-                     1.0 / UPDATE_INTERVAL, len(self._enabled_stat_types))
+        logging.info("Streaming TLV stats at %.1f Hz, down to %.1f Hz while steady "
+                     "(%d stat types)", 1.0 / UPDATE_INTERVAL, 1.0 / STATS_MAX_INTERVAL,
+                     len(self._enabled_stat_types))
 
         pc_locked = False
-        TIME_SYNC_INTERVAL = 12 * 3600  # Sync time every 12 hours
-        last_time_sync = 0  # Force immediate sync on first loop
+        TIME_SYNC_INTERVAL_NS = 12 * 3600 * 1000000000  # Sync time every 12 hours
+        last_time_sync = None  # Force immediate sync on first loop
+        last_packed = None     # Last stats packet written, and when
+        last_stats_sent = 0
+        keepalive_ns = int(STATS_KEEPALIVE * 1000000000)
+        last_profile_log = time.monotonic()
+
+        # Adaptive sampling: the period doubles (up to STATS_MAX_INTERVAL)
+        # after STATS_BACKOFF_TICKS steady ticks and drops back to
+        # UPDATE_INTERVAL as soon as any stat moves.
+        interval = UPDATE_INTERVAL
+        self._set_stats_interval(interval)
+        steady_ticks = 0
+        last_collected = None
+        next_tick = time.monotonic() + interval
 
         while self._running:
             if shutdown_event.is_set():
                 logging.info("System shutdown detected, notifying bridge...")
-                send_power_state(self._device, POWER_SHUTDOWN, self._hid_lock)
+                send_power_state(self._hid_tx, POWER_SHUTDOWN)
+                self._flush_hid_tx()
                 self._running = False
-                running = False
+                _wake_main()
                 break
 
             # Session lock/unlock detection
@@ -1526,15 +2566,55 @@ class CompanionService:
                 if lock_event.is_set() and not pc_locked:
                     pc_locked = True
                     logging.info("Sending POWER_LOCKED to display")
-                    send_power_state(self._device, POWER_LOCKED, self._hid_lock)
+                    send_power_state(self._hid_tx, POWER_LOCKED)
                 elif unlock_event.is_set() and pc_locked:
                     pc_locked = False
                     logging.info("Sending POWER_WAKE to display (unlocked)")
-                    send_power_state(self._device, POWER_WAKE, self._hid_lock)
+                    send_power_state(self._hid_tx, POWER_WAKE)
+
+            # Absolute-deadline pacing: time spent collecting and writing
+            # doesn't accumulate into drift. A wake-up before the deadline
+            # goes back to the top to handle the event, same deadline.
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                if select.select([_stats_wake_fd], [], [], delay)[0]:
+                    try:
+                        os.eventfd_read(_stats_wake_fd)
+                    except OSError:
+                        pass
+                    continue
+            elif delay < -interval:
+                next_tick -= delay  # Fell a full period behind: resync, don't burst
+            next_tick += interval
+
+            # The writer thread flags failed writes; reconnect from here
+            if self._hid_write_failed.is_set():
+                self._hid_write_failed.clear()
+                with self._hid_read_lock, self._hid_lock:
+                    try:
+                        self._device.close()
+                    except Exception:
+                        pass
+                    self._device = None
+                self._set_bridge_connected(False)
 
-            time.sleep(UPDATE_INTERVAL)
-            if not self._running:
-                break
+                # Reconnect
+                if not self._connect_bridge():
+                    break
+                # Restart vendor read thread for new device
+                self._vendor_thread = threading.Thread(
+                    target=self._vendor_read_loop, daemon=True
+                )
+                self._vendor_thread.start()
+                prev_net = get_net_counters(self._net_interface) or get_net_counters()
+                prev_time = time.monotonic_ns()
+                interval = UPDATE_INTERVAL
+                self._set_stats_interval(interval)
+                steady_ticks = 0
+                next_tick = time.monotonic() + interval
+                last_time_sync = None  # Resync the clock on the new connection
+                last_packed = last_collected = None
+                continue
 
             # Skip sending stats while PC is locked (display is in clock mode)
             if pc_locked:
@@ -1543,41 +2623,49 @@ class CompanionService:
             packed, prev_net, prev_time, prev_disk_io = collect_stats_tlv(
                 self._gpu, self._enabled_stat_types, prev_net, prev_time, prev_disk_io,
                 self._net_interface, self._disk_device, self._disk_mount,
-                self._proc_update_interval, self._proc_state
+                self._proc_update_interval, self._proc_state, self._stat_collectors,
+                _HDR_STATS
             )
 
-            try:
-                with self._hid_lock:
-                    self._device.write(b"\x06" + bytes([MSG_STATS]) + packed)
+            if _stats_steady(last_collected, packed, len(_HDR_STATS)):
+                steady_ticks += 1
+                if steady_ticks >= STATS_BACKOFF_TICKS and interval < STATS_MAX_INTERVAL:
+                    interval = min(interval * 2, STATS_MAX_INTERVAL)
+                    steady_ticks = 0
+                    self._set_stats_interval(interval)
+            else:
+                steady_ticks = 0
+                if interval != UPDATE_INTERVAL:
+                    interval = UPDATE_INTERVAL
+                    next_tick = min(next_tick, time.monotonic() + interval)
+                    self._set_stats_interval(interval)
+            last_collected = packed
+
+            # prev_time is this tick's monotonic_ns timestamp. On an idle
+            # machine most ticks repeat the previous packet; send those only
+            # often enough to keep the display in stats mode, i.e. unless
+            # skipping this one would leave more than keepalive_ns until the
+            # next tick.
+            if (packed != last_packed or
+                    prev_time + int(interval * 1000000000) > last_stats_sent + keepalive_ns):
+                self._post_stats(packed)
+                last_packed = packed
+                last_stats_sent = prev_time
                 self._stats_count += 1
                 if self.on_stats_sent:
                     self.on_stats_sent()
-            except (IOError, OSError) as exc:
-                logging.warning("HID write failed (device disconnected?): %s", exc)
-                try:
-                    self._device.close()
-                except Exception:
-                    pass
-                self._device = None
-                self._set_bridge_connected(False)
-
-                # Reconnect
-                if not self._connect_bridge():
-                    break
-                # Restart vendor read thread for new device
-                self._vendor_thread = threading.Thread(
-                    target=self._vendor_read_loop, daemon=True
-                )
-                self._vendor_thread.start()
-                prev_net = psutil.net_io_counters()
-                prev_time = time.time()
-                continue
-
-            if self._device is not None:
-                now = time.time()
-                if now - last_time_sync >= TIME_SYNC_INTERVAL:
-                    send_time_sync(self._device, self._hid_lock)
-                    last_time_sync = now
+            if last_time_sync is None or prev_time - last_time_sync >= TIME_SYNC_INTERVAL_NS:
+                send_time_sync(self._hid_tx)
+                last_time_sync = prev_time
+
+            if (self._stat_collectors.profile and
+                    time.monotonic() - last_profile_log >= PROFILE_LOG_INTERVAL):
+                last_profile_log = time.monotonic()
+                slowest = sorted(_collector_timings.items(), key=lambda kv: kv[1],
+                                 reverse=True)[:3]
+                logging.debug("Slowest stat collectors: %s",
+                              ", ".join("%s %.0f us" % (name, ns / 1000)
+                                        for name, ns in slowest))
 
         # Clean up
         if self._device is not None:
@@ -1594,7 +2682,7 @@ class CompanionService:
 # ---------------------------------------------------------------------------
 
 def main():
-    global running
+    global _wakeup_fd
 
     logging.basicConfig(
         level=logging.INFO,
@@ -1602,6 +2690,13 @@ def main():
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
+    # A 1 Hz background streamer; never compete with the user's workload
+    try:
+        os.nice(BACKGROUND_NICE)
+    except OSError as exc:
+        logging.debug("Could not lower priority: %s", exc)
+
+    _wakeup_fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
     signal.signal(signal.SIGINT, _signal_handler)
     signal.signal(signal.SIGTERM, _signal_handler)
 
@@ -1610,13 +2705,16 @@ def main():
     service = CompanionService()
     service.start()
 
+    # Sleep until a signal handler or the shutdown path writes the eventfd
     try:
-        while running:
-            time.sleep(1)
+        while not select.select([_wakeup_fd], [], [])[0]:
+            pass
     except KeyboardInterrupt:
         pass
 
     service.stop()
+    os.close(_wakeup_fd)
+    _wakeup_fd = None
     logging.info("Companion stopped.")
 
 
@@ -5,9 +5,38 @@ Posts config JSON to /api/config/upload endpoint with retry logic.
 Parses device responses and provides error feedback.
 """
 
+import random
 import requests
+import socket
 import time
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import BinaryIO, Dict, Any, Tuple, Union
+from urllib3.connection import HTTPConnection
+from urllib3.util import Retry
+
+# Optional: streams multipart uploads instead of building the body in memory
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+
+# upload_config retry backoff: full jitter over base * 2**attempt, capped
+RETRY_BACKOFF_CONNECT = 0.5  # Device may have just come up, retry soon
+RETRY_BACKOFF_TIMEOUT = 2.0  # Device busy, give it longer
+RETRY_BACKOFF_MAX = 5.0
+
+# urllib3's defaults (TCP_NODELAY) plus TCP keepalive, so a pooled connection
+# to a device that dropped off its SoftAP is noticed within ~10 s of idling.
+# The keepalive timing options are Linux-only; elsewhere the OS defaults apply.
+SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+] + [
+    (socket.IPPROTO_TCP, getattr(socket, name), value)
+    for name, value in (("TCP_KEEPIDLE", 3), ("TCP_KEEPINTVL", 2), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+]
 
 
 class HTTPClientError(Exception):
@@ -16,6 +45,14 @@ class HTTPClientError(Exception):
     pass
 
 
+class _DeviceAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections use SOCKET_OPTIONS."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
 class HTTPClient:
     """HTTP client for device communication"""
 
@@ -25,13 +62,34 @@ class HTTPClient:
         self.timeout = timeout
         self.base_url = f"http://{device_ip}:{port}"
 
+        # One keep-alive connection to the device instead of a fresh TCP
+        # connect per call. The adapter only retries idempotent requests that
+        # got a gateway error or lost a reused connection; connect failures
+        # go straight to the caller, whose own loops (wait_for_device,
+        # upload_config) decide how to retry.
+        retries = Retry(total=3, connect=0, read=1, backoff_factor=0.5,
+                        status_forcelist=(502, 503, 504), raise_on_status=False)
+        self._session = requests.Session()
+        self._session.mount("http://", _DeviceAdapter(pool_connections=1, pool_maxsize=2,
+                                                     max_retries=retries))
+
+    def close(self):
+        """Close the pooled device connection."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def health_check(self) -> bool:
         """
         Check if device is reachable via /api/health endpoint.
         Returns True if device responds with 200, False otherwise.
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/api/health",
                 timeout=3,
             )
@@ -41,6 +99,20 @@ class HTTPClient:
         except Exception:
             return False
 
+    def _post_file(self, url: str, field: str, filename: str, data: Union[bytes, BinaryIO],
+                   mime: str, form_data: Dict[str, str] = None) -> requests.Response:
+        """POST one file (plus form fields) as multipart/form-data.
+
+        With requests_toolbelt installed the body is streamed from data in
+        chunks; otherwise requests assembles it in memory.
+        """
+        if MultipartEncoder is not None:
+            encoder = MultipartEncoder(fields={**(form_data or {}), field: (filename, data, mime)})
+            return self._session.post(url, data=encoder, timeout=self.timeout,
+                                      headers={"Content-Type": encoder.content_type})
+        return self._session.post(url, files={field: (filename, data, mime)},
+                                  data=form_data, timeout=self.timeout)
+
     def wait_for_device(self, timeout: float = 10.0, interval: float = 1.0) -> bool:
         """
         Poll health_check until device responds or timeout expires.
@@ -52,21 +124,24 @@ class HTTPClient:
         Returns:
             True if device responded, False if timed out
         """
-        import time
         deadline = time.monotonic() + timeout
-        while time.monotonic() < deadline:
+        while True:
             if self.health_check():
                 return True
-            time.sleep(interval)
-        return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(interval, remaining))
 
-    def upload_config(self, json_str: str, filename: str = "config.json") -> Dict[str, Any]:
+    def upload_config(self, json_str: str, filename: str = "config.json",
+                      retry_budget: float = 30.0) -> Dict[str, Any]:
         """
         Upload config JSON to device.
 
         Args:
             json_str: JSON config as string
             filename: Filename for upload (default: config.json)
+            retry_budget: Seconds after which no new attempt is started
 
         Returns:
             Dict with keys:
@@ -83,10 +158,12 @@ class HTTPClient:
             "config": (filename, json_str, "application/json"),
         }
 
-        # Retry logic: up to 3 attempts with 5-second interval
-        for attempt in range(3):
+        # Retry with jittered exponential backoff until retry_budget runs out
+        deadline = time.monotonic() + retry_budget
+        attempt = 0
+        while True:
             try:
-                response = requests.post(
+                response = self._session.post(
                     url,
                     files=files,
                     timeout=self.timeout,
@@ -127,35 +204,29 @@ class HTTPClient:
                     }
 
             except requests.Timeout:
-                error_msg = f"Connection timeout (attempt {attempt + 1}/3)"
-                if attempt < 2:
-                    # Retry after delay
-                    time.sleep(5)
-                    continue
-                else:
-                    raise HTTPClientError(error_msg)
+                error_msg = f"Connection timeout (attempt {attempt + 1})"
+                base = RETRY_BACKOFF_TIMEOUT
 
             except requests.ConnectionError:
-                error_msg = f"Cannot reach device (attempt {attempt + 1}/3)"
-                if attempt < 2:
-                    # Retry after delay
-                    time.sleep(5)
-                    continue
-                else:
-                    raise HTTPClientError(error_msg)
+                error_msg = f"Cannot reach device (attempt {attempt + 1})"
+                base = RETRY_BACKOFF_CONNECT
 
             except Exception as e:
                 raise HTTPClientError(f"Request failed: {str(e)}")
 
-        raise HTTPClientError("Upload failed after 3 attempts")
+            delay = random.uniform(0, min(RETRY_BACKOFF_MAX, base * 2 ** attempt))
+            if time.monotonic() + delay >= deadline:
+                raise HTTPClientError(error_msg)
+            time.sleep(delay)
+            attempt += 1
 
-    def upload_image(self, filename: str, data: bytes) -> Dict[str, Any]:
+    def upload_image(self, filename: str, data: Union[bytes, BinaryIO]) -> Dict[str, Any]:
         """
         Upload an image file to device SD card.
 
         Args:
             filename: Destination filename (e.g., "calc.png")
-            data: Raw image bytes (PNG)
+            data: Raw image bytes (PNG) or a binary file object
 
         Returns:
             Dict with "success" and "path" or "error" keys
@@ -165,12 +236,8 @@ class HTTPClient:
         """
         url = f"{self.base_url}/api/image/upload"
 
-        files = {
-            "image": (filename, data, "image/png"),
-        }
-
         try:
-            response = requests.post(url, files=files, timeout=self.timeout)
+            response = self._post_file(url, "image", filename, data, "image/png")
 
             if response.status_code == 200:
                 try:
@@ -190,13 +257,14 @@ class HTTPClient:
         except Exception as e:
             raise HTTPClientError(f"Image upload failed: {str(e)}")
 
-    def sd_upload_image(self, filename: str, data: bytes, folder: str = "icons") -> Dict[str, Any]:
+    def sd_upload_image(self, filename: str, data: Union[bytes, BinaryIO],
+                        folder: str = "icons") -> Dict[str, Any]:
         """
         Upload an image file to a specific folder on the device SD card.
 
         Args:
             filename: Destination filename (e.g., "photo.jpg")
-            data: Raw image bytes
+            data: Raw image bytes or a binary file object
             folder: Target folder on SD card ("icons" or "pictures")
 
         Returns:
@@ -216,15 +284,12 @@ class HTTPClient:
         else:
             mime = "image/png"
 
-        files = {
-            "image": (filename, data, mime),
-        }
         form_data = {
             "folder": folder,
         }
 
         try:
-            response = requests.post(url, files=files, data=form_data, timeout=self.timeout)
+            response = self._post_file(url, "image", filename, data, mime, form_data)
 
             if response.status_code == 200:
                 try:
@@ -256,7 +321,7 @@ class HTTPClient:
         """
         url = f"{self.base_url}/api/sd/usage"
         try:
-            response = requests.get(url, timeout=5)
+            response = self._session.get(url, timeout=5)
             response.raise_for_status()
             return response.json()
         except requests.Timeout:
@@ -281,7 +346,7 @@ class HTTPClient:
         """
         url = f"{self.base_url}/api/sd/list"
         try:
-            response = requests.get(url, params={"path": path}, timeout=5)
+            response = self._session.get(url, params={"path": path}, timeout=5)
             response.raise_for_status()
             return response.json()
         except requests.Timeout:
@@ -291,6 +356,27 @@ class HTTPClient:
         except Exception as e:
             raise HTTPClientError(f"SD list failed: {str(e)}")
 
+    def sd_status(self, path: str = "/") -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Fetch SD card usage and a directory listing concurrently.
+
+        The two requests run side by side on the session's two pooled
+        connections, so a refresh costs about one round trip instead of two.
+
+        Args:
+            path: Directory path on SD card (default: root)
+
+        Returns:
+            Tuple of (sd_usage() result, sd_list(path) result)
+
+        Raises:
+            HTTPClientError: On connection failure of either request
+        """
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            usage = pool.submit(self.sd_usage)
+            listing = self.sd_list(path)
+            return usage.result(), listing
+
     def sd_delete(self, path: str) -> Dict[str, Any]:
         """
         Delete a file from SD card.
@@ -306,7 +392,7 @@ class HTTPClient:
         """
         url = f"{self.base_url}/api/sd/delete"
         try:
-            response = requests.post(url, json={"path": path}, timeout=5)
+            response = self._session.post(url, json={"path": path}, timeout=5)
             response.raise_for_status()
             return response.json()
         except requests.Timeout:
@@ -9,6 +9,13 @@ import struct
 from io import BytesIO
 from PIL import Image
 
+# SJPG header fields after magic/version: width, height, total_frames, split_height
+_SJPG_HEADER = struct.Struct("<4H")
+
+# LANCZOS resizes first shrink by an integer factor with a box filter while
+# the image is over this many times the target size; visually lossless.
+_REDUCING_GAP = 3.0
+
 
 def _open_image(input_path: str, target_width: int = 256, target_height: int = 256) -> Image.Image:
     """Open an image file, handling SVG conversion if needed."""
@@ -19,7 +26,12 @@ def _open_image(input_path: str, target_width: int = 256, target_height: int = 2
             return Image.open(BytesIO(png_data))
         except ImportError:
             raise ValueError("SVG support requires cairosvg (pip install cairosvg)")
-    return Image.open(input_path)
+    img = Image.open(input_path)
+    # JPEGs can decode at 1/2, 1/4 or 1/8 scale (never below the target),
+    # which is far cheaper than decoding a multi-megapixel photo in full
+    if img.format == "JPEG":
+        img.draft(img.mode, (target_width, target_height))
+    return img
 
 
 def optimize_icon(input_path: str, max_width: int, max_height: int) -> bytes:
@@ -62,13 +74,13 @@ def _fit_with_matte(img: Image.Image, width: int, height: int) -> Image.Image:
     img_ratio = img.width / img.height
     canvas_ratio = width / height
     if abs(img_ratio - canvas_ratio) < 0.01:
-        return img.resize((width, height), Image.LANCZOS)
+        return img.resize((width, height), Image.LANCZOS, reducing_gap=_REDUCING_GAP)
 
     # Create matte: zoom-to-fill (cover) + blur
     cover_scale = max(width / img.width, height / img.height)
     cover_w = int(img.width * cover_scale)
     cover_h = int(img.height * cover_scale)
-    matte = img.resize((cover_w, cover_h), Image.LANCZOS)
+    matte = img.resize((cover_w, cover_h), Image.LANCZOS, reducing_gap=_REDUCING_GAP)
     # Center-crop to canvas size
     left = (cover_w - width) // 2
     top = (cover_h - height) // 2
@@ -77,7 +89,7 @@ def _fit_with_matte(img: Image.Image, width: int, height: int) -> Image.Image:
 
     # Fit foreground: contain (fit within canvas, preserve aspect ratio)
     fg = img.copy()
-    fg.thumbnail((width, height), Image.LANCZOS)
+    fg.thumbnail((width, height), Image.LANCZOS, reducing_gap=_REDUCING_GAP)
     fg_x = (width - fg.width) // 2
     fg_y = (height - fg.height) // 2
     matte.paste(fg, (fg_x, fg_y))
@@ -135,12 +147,8 @@ def optimize_for_sjpg(input_path: str, width: int = 800, height: int = 480) -> b
     out = BytesIO()
     out.write(b"_SJPG__\x00")                           # magic
     out.write(b"V1.00\x00")                              # version
-    out.write(struct.pack("<H", w))                       # width
-    out.write(struct.pack("<H", h))                       # height
-    out.write(struct.pack("<H", total_frames))            # total_frames
-    out.write(struct.pack("<H", SPLIT_HEIGHT))            # split_height
-    for s in strips:
-        out.write(struct.pack("<H", len(s)))              # frame sizes
+    out.write(_SJPG_HEADER.pack(w, h, total_frames, SPLIT_HEIGHT))
+    out.write(struct.pack(f"<{total_frames}H", *map(len, strips)))  # frame sizes
     for s in strips:
         out.write(s)                                      # JPEG data
     return out.getvalue()
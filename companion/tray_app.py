@@ -161,6 +161,8 @@ class CrowPanelTray(QApplication):
 
     def _update_status(self):
         text = self._service.status_text
+        if text == self._status_action.text():
+            return  # Called every stats tick; usually nothing changed
         self._status_action.setText(text)
         self._tray.setToolTip(f"CrowPanel — {text}")
 
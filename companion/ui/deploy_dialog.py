@@ -168,40 +168,41 @@ class DeployWorker(QThread):
 
             # 5. Wait for device health
             self.step_started.emit("health")
-            client = HTTPClient()
-            if not client.wait_for_device(timeout=10, interval=1):
-                raise HTTPClientError("Device not responding after WiFi connect")
-            self.step_done.emit("health")
-
-            # 6. Upload images (non-fatal: warn but continue if upload fails)
-            self.step_started.emit("images")
-            image_warnings = []
-            if self.pending_images:
-                for filename, data in self.pending_images.items():
-                    try:
-                        result = client.upload_image(filename, data)
-                        if not result.get("success"):
-                            image_warnings.append(f"{filename}: {result.get('error', 'unknown')}")
-                    except Exception as e:
-                        image_warnings.append(f"{filename}: {e}")
-            if self.pending_bg_images:
-                for filename, data in self.pending_bg_images.items():
-                    try:
-                        result = client.sd_upload_image(filename, data, folder="bkgnds")
-                        if not result.get("success"):
-                            image_warnings.append(f"bg/{filename}: {result.get('error', 'unknown')}")
-                    except Exception as e:
-                        image_warnings.append(f"bg/{filename}: {e}")
-            self.step_done.emit("images")
-
-            # 7. Upload config
-            self.step_started.emit("config")
-            result = client.upload_config(self.json_str)
-            if not result.get("success"):
-                raise HTTPClientError(
-                    result.get("error", "Config upload rejected by device")
-                )
-            self.step_done.emit("config")
+            # Closed (dropping its keep-alive socket) before WiFi is restored
+            with HTTPClient() as client:
+                if not client.wait_for_device(timeout=10, interval=1):
+                    raise HTTPClientError("Device not responding after WiFi connect")
+                self.step_done.emit("health")
+
+                # 6. Upload images (non-fatal: warn but continue if upload fails)
+                self.step_started.emit("images")
+                image_warnings = []
+                if self.pending_images:
+                    for filename, data in self.pending_images.items():
+                        try:
+                            result = client.upload_image(filename, data)
+                            if not result.get("success"):
+                                image_warnings.append(f"{filename}: {result.get('error', 'unknown')}")
+                        except Exception as e:
+                            image_warnings.append(f"{filename}: {e}")
+                if self.pending_bg_images:
+                    for filename, data in self.pending_bg_images.items():
+                        try:
+                            result = client.sd_upload_image(filename, data, folder="bkgnds")
+                            if not result.get("success"):
+                                image_warnings.append(f"bg/{filename}: {result.get('error', 'unknown')}")
+                        except Exception as e:
+                            image_warnings.append(f"bg/{filename}: {e}")
+                self.step_done.emit("images")
+
+                # 7. Upload config
+                self.step_started.emit("config")
+                result = client.upload_config(self.json_str)
+                if not result.get("success"):
+                    raise HTTPClientError(
+                        result.get("error", "Config upload rejected by device")
+                    )
+                self.step_done.emit("config")
 
             # 8. Send CONFIG_DONE
             self.step_started.emit("config_done")
@@ -3677,16 +3677,16 @@ class SettingsTab(QScrollArea):
             return
 
         try:
-            # Get usage
-            usage = self._http_client.sd_usage()
+            usage, listing = self._http_client.sd_status("/")
+
+            # Usage
             total = usage.get("total_mb", 0)
             used = usage.get("used_mb", 0)
             self.sd_usage_bar.setMaximum(max(total, 1))
             self.sd_usage_bar.setValue(used)
             self.sd_usage_bar.setFormat(f"{used} MB / {total} MB")
 
-            # Get file listing
-            listing = self._http_client.sd_list("/")
+            # File listing
             self.sd_tree.clear()
             from PySide6.QtWidgets import QTreeWidgetItem
             for f in listing.get("files", []):
@@ -91,30 +91,31 @@ class SlideshowUploadWorker(QThread):
 
             # 5. Wait for device health
             self.step_started.emit("health")
-            client = HTTPClient()
-            if not client.wait_for_device(timeout=10, interval=1):
-                raise HTTPClientError("Device not responding after WiFi connect")
-            self.step_done.emit("health")
-
-            # 6. Upload images
-            self.step_started.emit("upload")
-            total = len(self._file_paths)
-            errors = []
-            for i, path in enumerate(self._file_paths):
-                self.upload_progress.emit(i + 1, total)
-                basename = os.path.basename(path)
-                name_root = os.path.splitext(basename)[0]
-                dest_name = name_root + ".sjpg"
-
-                try:
-                    data = optimize_for_slideshow(path)
-                    result = client.sd_upload_image(dest_name, data, folder="pictures")
-                    if not result.get("success"):
-                        errors.append(f"{basename}: {result.get('error', 'unknown')}")
-                except Exception as e:
-                    errors.append(f"{basename}: {e}")
-
-            self.step_done.emit("upload")
+            # Closed (dropping its keep-alive socket) before WiFi is restored
+            with HTTPClient() as client:
+                if not client.wait_for_device(timeout=10, interval=1):
+                    raise HTTPClientError("Device not responding after WiFi connect")
+                self.step_done.emit("health")
+
+                # 6. Upload images
+                self.step_started.emit("upload")
+                total = len(self._file_paths)
+                errors = []
+                for i, path in enumerate(self._file_paths):
+                    self.upload_progress.emit(i + 1, total)
+                    basename = os.path.basename(path)
+                    name_root = os.path.splitext(basename)[0]
+                    dest_name = name_root + ".sjpg"
+
+                    try:
+                        data = optimize_for_slideshow(path)
+                        result = client.sd_upload_image(dest_name, data, folder="pictures")
+                        if not result.get("success"):
+                            errors.append(f"{basename}: {result.get('error', 'unknown')}")
+                    except Exception as e:
+                        errors.append(f"{basename}: {e}")
+
+                self.step_done.emit("upload")
 
             # 7. Send CONFIG_DONE
             self.step_started.emit("config_done")